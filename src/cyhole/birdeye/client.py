@@ -1,8 +1,11 @@
 from __future__ import annotations
+import asyncio
 import requests
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
+from urllib3.util import Retry
 
+from ..core.param import RequestType
 from ..core.client import APIClient, AsyncAPIClient
 from ..core.exception import AuthorizationAPIKeyError
 from ..birdeye.exception import BirdeyeAuthorisationError
@@ -37,17 +40,26 @@ class BirdeyeClient(APIClient):
         Client used for synchronous API calls for `Birdeye` interaction.
     """
 
-    def __init__(self, interaction: Birdeye, headers: Any | None = None) -> None:
-        super().__init__(interaction, headers)
+    def __init__(self, interaction: Birdeye, headers: Any | None = None, max_retries: int | Retry = 0) -> None:
+        super().__init__(interaction, headers, max_retries)
         self._interaction: Birdeye = self._interaction
 
     def api(self, type: str, url: str, *args: tuple, **kwargs: dict[str, Any]) -> requests.Response:
+        # serve cached response
+        params = kwargs.get("params")
+        response = self._interaction._load_cached_response(type, url, params)
+        if response is not None:
+            return response
+
         # overide function to manage client specific exceptions
         try:
-            return super().api(type, url, *args, **kwargs)
+            response = super().api(type, url, *args, **kwargs)
         except AuthorizationAPIKeyError:
             raise BirdeyeAuthorisationError
 
+        self._interaction._store_cached_response(type, url, params, response)
+        return response
+
     def get_token_list(self, sort_by: str = BirdeyeSort.SORT_V24HUSD.value, order_by: str = BirdeyeOrder.DESCENDING.value, offset: int | None = None, limit: int | None = None) -> GetTokenListResponse:
         """
             Call the Birdeye's **PUBLIC** API endpoint **[Token - List](https://docs.birdeye.so/reference/get_defi-tokenlist)** for synchronous logic. 
@@ -83,14 +95,14 @@ class BirdeyeClient(APIClient):
         """
         return self._interaction._get_price(True, address, include_liquidity)
 
-    def get_price_multiple(self, list_address: list[str], include_liquidity: bool | None = None) -> GetPriceMultipleResponse:
+    def get_price_multiple(self, list_address: list[str], include_liquidity: bool | None = None, max_concurrency: int = 8) -> GetPriceMultipleResponse:
         """
             Call the Birdeye's **PUBLIC** API endpoint **[Price - Multiple](https://docs.birdeye.so/reference/get_defi-multi-price)** for synchronous logic. 
             All the API endopint details are available on [`Birdeye._get_price_multiple`][cyhole.birdeye.interaction.Birdeye._get_price_multiple].
         """
-        return self._interaction._get_price_multiple(True, list_address, include_liquidity)
+        return self._interaction._get_price_multiple(True, list_address, include_liquidity, max_concurrency)
 
-    def get_price_historical(self, address: str, address_type: str, timeframe: str, dt_from: datetime, dt_to: datetime | None = None) -> GetPriceHistoricalResponse:
+    def get_price_historical(self, address: str, address_type: str, timeframe: str, dt_from: datetime | int, dt_to: datetime | int | None = None) -> GetPriceHistoricalResponse:
         """
             Call the Birdeye's **PUBLIC** API endpoint **[Price - Historical](https://docs.birdeye.so/reference/get_defi-history-price)** for synchronous logic. 
             All the API endopint details are available on [`Birdeye._get_price_historical`][cyhole.birdeye.interaction.Birdeye._get_price_historical].
@@ -125,14 +137,14 @@ class BirdeyeClient(APIClient):
         """
         return self._interaction._get_trades_pair(True, address, trade_type, order_by, offset, limit)
 
-    def get_ohlcv(self, address: str, address_type: str, timeframe: str, dt_from: datetime, dt_to: datetime | None = None) -> GetOHLCVTokenPairResponse:
+    def get_ohlcv(self, address: str, address_type: str, timeframe: str, dt_from: datetime | int, dt_to: datetime | int | None = None) -> GetOHLCVTokenPairResponse:
         """
             Call the Birdeye's **PRIVATE** API endpoint **[OHLCV - Token/Pair](https://docs.birdeye.so/reference/get_defi-ohlcv)** for synchronous logic. 
             All the API endopint details are available on [`Birdeye._get_ohlcv`][cyhole.birdeye.interaction.Birdeye._get_ohlcv].
         """
         return self._interaction._get_ohlcv(True, address, address_type, timeframe, dt_from, dt_to)
 
-    def get_ohlcv_base_quote(self, base_address: str, quote_address: str, timeframe: str, dt_from: datetime, dt_to: datetime | None = None) -> GetOHLCVBaseQuoteResponse:
+    def get_ohlcv_base_quote(self, base_address: str, quote_address: str, timeframe: str, dt_from: datetime | int, dt_to: datetime | int | None = None) -> GetOHLCVBaseQuoteResponse:
         """
             Call the Birdeye's **PRIVATE** API endpoint **[OHLCV - Base/Quote](https://docs.birdeye.so/reference/get_defi-ohlcv-base-quote)** for synchronous logic. 
             All the API endopint details are available on [`Birdeye._get_ohlcv_base_quote`][cyhole.birdeye.interaction.Birdeye._get_ohlcv_base_quote].
@@ -149,19 +161,45 @@ class BirdeyeClient(APIClient):
 class BirdeyeAsyncClient(AsyncAPIClient):
     """
         Client used for asynchronous API calls for `Birdeye` interaction.
+
+        Identical `GET` requests executed concurrently are sent only once, 
+        and all the callers receive the response of the same request.
     """
 
     def __init__(self, interaction: Birdeye, headers: Any | None = None) -> None:
         super().__init__(interaction, headers)
         self._interaction: Birdeye = self._interaction
+        self._inflight: dict[tuple[str, tuple], asyncio.Task[requests.Response]] = {}
 
     async def api(self, type: str, url: str, *args: tuple, **kwargs: dict[str, Any]) -> requests.Response:
+        if type != RequestType.GET.value or args or kwargs.keys() - {"params"}:
+            return await self._api(type, url, *args, **kwargs)
+
+        # share the request in flight with the same URL and params
+        key = (url, tuple(sorted((kwargs.get("params") or {}).items())))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._api(type, url, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _api(self, type: str, url: str, *args: tuple, **kwargs: dict[str, Any]) -> requests.Response:
+        # serve cached response
+        params = kwargs.get("params")
+        response = self._interaction._load_cached_response(type, url, params)
+        if response is not None:
+            return response
+
         # overide function to manage client specific exceptions
         try:
-            return await super().api(type, url, *args, **kwargs)
+            response = await super().api(type, url, *args, **kwargs)
         except AuthorizationAPIKeyError:
             raise BirdeyeAuthorisationError
 
+        self._interaction._store_cached_response(type, url, params, response)
+        return response
+
     async def get_token_list(self, sort_by: str = BirdeyeSort.SORT_V24HUSD.value, order_by: str = BirdeyeOrder.DESCENDING.value, offset: int | None = None, limit: int | None = None) -> GetTokenListResponse:
         """
             Call the Birdeye's **PUBLIC** API endpoint **[Token - List](https://docs.birdeye.so/reference/get_defi-tokenlist)** for asynchronous logic. 
@@ -197,20 +235,41 @@ class BirdeyeAsyncClient(AsyncAPIClient):
         """
         return await self._interaction._get_price(False, address, include_liquidity)
 
-    async def get_price_multiple(self, list_address: list[str], include_liquidity: bool | None = None) -> GetPriceMultipleResponse:
+    async def get_price_multiple(self, list_address: list[str], include_liquidity: bool | None = None, max_concurrency: int = 8) -> GetPriceMultipleResponse:
         """
             Call the Birdeye's **PUBLIC** API endpoint **[Price - Multiple](https://docs.birdeye.so/reference/get_defi-multi-price)** for asynchronous logic. 
             All the API endopint details are available on [`Birdeye._get_price_multiple`][cyhole.birdeye.interaction.Birdeye._get_price_multiple].
         """
-        return await self._interaction._get_price_multiple(False, list_address, include_liquidity)
+        return await self._interaction._get_price_multiple(False, list_address, include_liquidity, max_concurrency)
 
-    async def get_price_historical(self, address: str, address_type: str, timeframe: str, dt_from: datetime, dt_to: datetime | None = None) -> GetPriceHistoricalResponse:
+    async def get_price_historical(self, address: str, address_type: str, timeframe: str, dt_from: datetime | int, dt_to: datetime | int | None = None) -> GetPriceHistoricalResponse:
         """
             Call the Birdeye's **PUBLIC** API endpoint **[Price - Historical](https://docs.birdeye.so/reference/get_defi-history-price)** for asynchronous logic. 
             All the API endopint details are available on [`Birdeye._get_price_historical`][cyhole.birdeye.interaction.Birdeye._get_price_historical].
         """
         return await self._interaction._get_price_historical(False, address, address_type, timeframe, dt_from, dt_to)
 
+    async def get_price_historical_many(self, list_address: list[str], address_type: str, timeframe: str, dt_from: datetime | int, dt_to: datetime | int | None = None, max_concurrency: int = 32) -> list[GetPriceHistoricalResponse]:
+        """
+            Call the Birdeye's **PUBLIC** API endpoint **[Price - Historical](https://docs.birdeye.so/reference/get_defi-history-price)** for asynchronous logic 
+            on a list of addresses, by executing the requests concurrently on the open session.
+            All the API endopint details are available on [`Birdeye._get_price_historical`][cyhole.birdeye.interaction.Birdeye._get_price_historical].
+
+            Parameters:
+                list_address: list of CA of the tokens to search on the chain.
+                max_concurrency: maximum number of requests in flight at the same time.
+
+            Returns:
+                list of responses, in the same order of `list_address`.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def get_price_historical(address: str) -> GetPriceHistoricalResponse:
+            async with semaphore:
+                return await self._interaction._get_price_historical(False, address, address_type, timeframe, dt_from, dt_to)
+
+        return list(await asyncio.gather(*(get_price_historical(address) for address in list_address)))
+
     async def get_price_volume_single(self, address: str, timeframe: str = BirdeyeHourTimeFrame.H24.value) -> GetPriceVolumeSingleResponse:
         """
             Call the Birdeye's **PRIVATE** API endpoint **[Price Volume - Single Token](https://docs.birdeye.so/reference/get_defi-price-volume-single)** for asynchronous logic. 
@@ -239,14 +298,14 @@ class BirdeyeAsyncClient(AsyncAPIClient):
         """
         return await self._interaction._get_trades_pair(False, address, trade_type, order_by, offset, limit)
 
-    async def get_ohlcv(self, address: str, address_type: str, timeframe: str, dt_from: datetime, dt_to: datetime | None = None) -> GetOHLCVTokenPairResponse:
+    async def get_ohlcv(self, address: str, address_type: str, timeframe: str, dt_from: datetime | int, dt_to: datetime | int | None = None) -> GetOHLCVTokenPairResponse:
         """
             Call the Birdeye's **PRIVATE** API endpoint **[OHLCV - Token/Pair](https://docs.birdeye.so/reference/get_defi-ohlcv)** for asynchronous logic. 
             All the API endopint details are available on [`Birdeye._get_ohlcv`][cyhole.birdeye.interaction.Birdeye._get_ohlcv].
         """
         return await self._interaction._get_ohlcv(False, address, address_type, timeframe, dt_from, dt_to)
 
-    async def get_ohlcv_base_quote(self, base_address: str, quote_address: str, timeframe: str, dt_from: datetime, dt_to: datetime | None = None) -> GetOHLCVBaseQuoteResponse:
+    async def get_ohlcv_base_quote(self, base_address: str, quote_address: str, timeframe: str, dt_from: datetime | int, dt_to: datetime | int | None = None) -> GetOHLCVBaseQuoteResponse:
         """
             Call the Birdeye's **PRIVATE** API endpoint **[OHLCV - Base/Quote](https://docs.birdeye.so/reference/get_defi-ohlcv-base-quote)** for asynchronous logic. 
             All the API endopint details are available on [`Birdeye._get_ohlcv_base_quote`][cyhole.birdeye.interaction.Birdeye._get_ohlcv_base_quote].
@@ -1,8 +1,16 @@
 import os
-from typing import Coroutine, Literal, overload
-from datetime import datetime
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Coroutine, Literal, overload
+from urllib.parse import urlsplit
+from datetime import datetime, timedelta, timezone
+
+from requests import Response
+from urllib3.util import Retry
 
 from ..core.param import RequestType
+from ..core.cache import Cache
 from ..core.interaction import Interaction
 from ..core.exception import MissingAPIKeyError
 from ..birdeye.client import BirdeyeClient, BirdeyeAsyncClient
@@ -33,6 +41,59 @@ from ..birdeye.schema import (
     GetWalletSupportedNetworksResponse
 )
 
+# request types bound once, instead of resolving the enum members on every call
+_GET = RequestType.GET.value
+_POST = RequestType.POST.value
+
+_EPOCH = datetime(1970, 1, 1, tzinfo = timezone.utc)
+_SECOND = timedelta(seconds = 1)
+
+def _to_unix(value: datetime | int) -> int:
+    """
+        Internal function used to convert a datetime in unix timestamp.
+        The unix timestamps are returned as they are, the timezone-aware datetimes 
+        are converted with a subtraction from the epoch (no timezone database lookup), 
+        while the naive ones are still interpreted in local time by `datetime.timestamp`.
+        The booleans are rejected, even if they are `int` for Python.
+    """
+    if isinstance(value, bool):
+        raise BirdeyeTimeRangeError(f"Invalid time provided: {value!r}")
+    if isinstance(value, int):
+        return value
+    if value.tzinfo is None:
+        return int(value.timestamp())
+    return (value - _EPOCH) // _SECOND
+
+# time-to-live (seconds) of the cached responses, by endpoint's path
+_CACHE_TTL = {
+    "defi/tokenlist": 300,
+    "defi/token_creation_info": 3600,
+    "defi/token_security": 3600,
+    "defi/token_overview": 300,
+    "defi/price": 30,
+    "defi/multi_price": 30,
+    "defi/history_price": 30,
+    "defi/ohlcv": 30,
+    "defi/ohlcv/pair": 30,
+    "defi/ohlcv/base_quote": 30,
+    "v1/wallet/list_supported_chain": 3600
+}
+
+# endpoints returning time series on a time window, never expired once closed
+_CACHE_HISTORY_ENDPOINTS = frozenset({"defi/history_price", "defi/ohlcv", "defi/ohlcv/pair", "defi/ohlcv/base_quote"})
+
+# the historical prices older than this delay (seconds) are not changed anymore
+_CACHE_HISTORY_FINAL_DELAY = 3600
+
+# maximum number of addresses requested in a single call of "Price - Multiple"
+_PRICE_MULTIPLE_MAX_ADDRESSES = 100
+
+# status codes of the transient errors retried by the synchronous client
+_RETRY_STATUS = [429, 502, 503, 504]
+
+# default maximum number of concurrent requests of "Price - Multiple" chunks
+_MAX_WORKERS = 8
+
 class Birdeye(Interaction):
     """
         Class used to connect [https://birdeye.so](https://birdeye.so) API.
@@ -49,6 +110,16 @@ class Birdeye(Interaction):
             chain: identifier of the chain to use in all the requests.
                 The supported chains are available on [`BirdeyeChain`][cyhole.birdeye.param.BirdeyeChain].
                 Import them from the library to use the correct identifier.
+            cache: optional [`Cache`][cyhole.core.cache.Cache] (e.g. [`FileCache`][cyhole.core.cache.FileCache] or [`MemoryCache`][cyhole.core.cache.MemoryCache]) used to store the responses of 
+                the endpoints **Token - Creation Info**, **Token - Security**, **Wallet - Supported Networks** (1 hour), 
+                **Token - List**, **Token - Overview** (5 minutes), **Price**, **Price - Multiple**, **Price - Historical**, 
+                **OHLCV** and **OHLCV - Base/Quote** (30 seconds). The historical prices and OHLCV ending more than 
+                one hour ago are never expired.
+            max_retries: maximum number of retries of the synchronous requests failed with 
+                a connection error or with status 429, 502, 503 or 504 (only `GET` requests).
+                By default, the requests are not retried.
+            backoff: backoff factor (seconds) of the exponential delay between the retries; 
+                the `Retry-After` header returned by the API is respected.
 
         **Example**
         ```python
@@ -74,7 +145,7 @@ class Birdeye(Interaction):
         Raises:
             MissingAPIKeyError: if no API Key was available during the object creation.
     """
-    def __init__(self, api_key: str | None = None, chain: str = BirdeyeChain.SOLANA.value) -> None:
+    def __init__(self, api_key: str | None = None, chain: str = BirdeyeChain.SOLANA.value, cache: Cache | None = None, max_retries: int = 0, backoff: float = 0.3) -> None:
 
         # set API
         self.api_key = api_key if api_key is not None else os.environ.get("BIRDEYE_API_KEY")
@@ -89,14 +160,60 @@ class Birdeye(Interaction):
         super().__init__(headers)
         self.headers: dict[str, str]
 
-        # clients
-        self.client = BirdeyeClient(self, headers = headers)
+        # clients (retries enabled on request)
+        retry = Retry(
+            total = max_retries,
+            backoff_factor = backoff,
+            status_forcelist = _RETRY_STATUS,
+            allowed_methods = [_GET],
+            raise_on_status = False
+        ) if max_retries > 0 else 0
+        self.client = BirdeyeClient(self, headers = headers, max_retries = retry)
         self.async_client = BirdeyeAsyncClient(self, headers = headers)
 
         # API urls
         self.url_api_public = "https://public-api.birdeye.so/defi/"
         self.url_api_private = "https://public-api.birdeye.so/defi/"
         self.url_api_private_wallet = "https://public-api.birdeye.so/v1/wallet"
+
+        # cache
+        self.cache = cache
+        return
+
+    def _get_cache_ttl(self, type: str, url: str, params: dict[str, Any] | None) -> float:
+        """
+            Internal function used to get the time-to-live (seconds) of the cached response 
+            of a request. The value is `0` when the response must not be cached.
+        """
+        if self.cache is None or type != _GET:
+            return 0
+        endpoint = urlsplit(url).path.lstrip("/")
+        if endpoint in _CACHE_HISTORY_ENDPOINTS and params and params["time_to"] < time.time() - _CACHE_HISTORY_FINAL_DELAY:
+            return float("inf")
+        return _CACHE_TTL.get(endpoint, 0)
+
+    def _load_cached_response(self, type: str, url: str, params: dict[str, Any] | None) -> Response | None:
+        """
+            Internal function used to get the cached response of a request, if still valid.
+        """
+        ttl = self._get_cache_ttl(type, url, params)
+        if not ttl:
+            return None
+        return self.cache.get(f"birdeye/{self.headers['x-chain']}", url, params, ttl)
+
+    def _store_cached_response(self, type: str, url: str, params: dict[str, Any] | None, response: Response) -> None:
+        """
+            Internal function used to store the response of a request, if it can be cached.
+            Only the successful responses (`"success": true`) are stored.
+        """
+        if not self._get_cache_ttl(type, url, params):
+            return
+        try:
+            success = response.json().get("success") is True
+        except (ValueError, AttributeError):
+            success = False
+        if success:
+            self.cache.set(f"birdeye/{self.headers['x-chain']}", url, params, response)
         return
 
     @overload
@@ -156,22 +273,23 @@ class Birdeye(Interaction):
 
         # set params
         url = self.url_api_public + "tokenlist"
-        params = {
+        params: dict[str, Any] = {
             "sort_by" : sort_by,
-            "sort_type" : order_by,
-            "offset" : offset,
-            "limit": limit
+            "sort_type" : order_by
         }
+        if offset is not None:
+            params["offset"] = offset
+        if limit is not None:
+            params["limit"] = limit
 
         # execute request
-        if sync:
-            content_raw = self.client.api(RequestType.GET.value, url, params = params)
-            return GetTokenListResponse(**content_raw.json())
-        else:
-            async def async_request():
-                content_raw = await self.async_client.api(RequestType.GET.value, url, params = params)
-                return GetTokenListResponse(**content_raw.json())
-            return async_request()
+        return self.api_return_model(
+            sync = sync,
+            type = _GET,
+            url = url,
+            response_model = GetTokenListResponse,
+            params = params
+        )
 
     @overload
     def _get_token_creation_info(
@@ -213,14 +331,13 @@ class Birdeye(Interaction):
         }
 
         # execute request
-        if sync:
-            content_raw = self.client.api(RequestType.GET.value, url, params = params)
-            return GetTokenCreationInfoResponse(**content_raw.json())
-        else:
-            async def async_request():
-                content_raw = await self.async_client.api(RequestType.GET.value, url, params = params)
-                return GetTokenCreationInfoResponse(**content_raw.json())
-            return async_request()
+        return self.api_return_model(
+            sync = sync,
+            type = _GET,
+            url = url,
+            response_model = GetTokenCreationInfoResponse,
+            params = params
+        )
 
     @overload
     def _get_token_security(
@@ -264,14 +381,13 @@ class Birdeye(Interaction):
         }
 
         # execute request
-        if sync:
-            content_raw = self.client.api(RequestType.GET.value, url, params = params)
-            return GetTokenSecurityResponse(**content_raw.json())
-        else:
-            async def async_request():
-                content_raw = await self.async_client.api(RequestType.GET.value, url, params = params)
-                return GetTokenSecurityResponse(**content_raw.json())
-            return async_request()
+        return self.api_return_model(
+            sync = sync,
+            type = _GET,
+            url = url,
+            response_model = GetTokenSecurityResponse,
+            params = params
+        )
 
     @overload
     def _get_token_overview(
@@ -315,14 +431,13 @@ class Birdeye(Interaction):
         }
 
         # execute request
-        if sync:
-            content_raw = self.client.api(RequestType.GET.value, url, params = params)
-            return GetTokenOverviewResponse(**content_raw.json())
-        else:
-            async def async_request():
-                content_raw = await self.async_client.api(RequestType.GET.value, url, params = params)
-                return GetTokenOverviewResponse(**content_raw.json())
-            return async_request()
+        return self.api_return_model(
+            sync = sync,
+            type = _GET,
+            url = url,
+            response_model = GetTokenOverviewResponse,
+            params = params
+        )
 
     @overload
     def _get_price(
@@ -364,26 +479,27 @@ class Birdeye(Interaction):
         """        # set params
         url = self.url_api_public + "price"
         params = {
-            "address" : address,
-            "include_liquidity" : str(include_liquidity).lower() if include_liquidity else None
+            "address" : address
         }
+        if include_liquidity:
+            params["include_liquidity"] = "true"
 
         # execute request
-        if sync:
-            content_raw = self.client.api(RequestType.GET.value, url, params = params)
-            return GetPriceResponse(**content_raw.json())
-        else:
-            async def async_request():
-                content_raw = await self.async_client.api(RequestType.GET.value, url, params = params)
-                return GetPriceResponse(**content_raw.json())
-            return async_request()
+        return self.api_return_model(
+            sync = sync,
+            type = _GET,
+            url = url,
+            response_model = GetPriceResponse,
+            params = params
+        )
 
     @overload
     def _get_price_multiple(
         self,
         sync: Literal[True],
         list_address: list[str],
-        include_liquidity: bool | None = None
+        include_liquidity: bool | None = None,
+        max_concurrency: int = _MAX_WORKERS
     ) -> GetPriceMultipleResponse: ...
 
     @overload
@@ -391,23 +507,32 @@ class Birdeye(Interaction):
         self,
         sync: Literal[False],
         list_address: list[str],
-        include_liquidity: bool | None = None
+        include_liquidity: bool | None = None,
+        max_concurrency: int = _MAX_WORKERS
     ) -> Coroutine[None, None, GetPriceMultipleResponse]: ...
 
     def _get_price_multiple(
         self,
         sync: bool,
         list_address: list[str],
-        include_liquidity: bool | None = None
+        include_liquidity: bool | None = None,
+        max_concurrency: int = _MAX_WORKERS
     ) -> GetPriceMultipleResponse | Coroutine[None, None, GetPriceMultipleResponse]:
         """
             This function refers to the **PRIVATE** API endpoint **[Price - Multiple](https://docs.birdeye.so/reference/get_defi-multi-price)** and is used 
             to get the current price of multeple tokens on a specific chain on Birdeye.
 
+            The addresses are stripped and deduplicated (keeping the input order), then 
+            requested in chunks of 100 tokens executed concurrently (threads in synchronous 
+            logic, tasks in asynchronous logic) up to `max_concurrency` requests at the same 
+            time, and the chunks' responses are merged in a single response.
+
             Parameters:
                 list_address: CA of the tokens to search on the chain.
                 include_liquidity: include the current liquidity of the token.
                     Default Value: `None` (`False`)
+                max_concurrency: maximum number of chunks requested at the same time; must be at least `1`.
+                    Default Value: `8`
 
             Returns:
                 list of tokens returned by birdeye.so.
@@ -415,22 +540,55 @@ class Birdeye(Interaction):
             Raises:
                 BirdeyeAuthorisationError: if the API key provided does not give access to related endpoint.
                 ParamUnknownError: if one of the input parameter belonging to the value list is aligned to it.
+                ValueError: if `max_concurrency` is lower than `1`.
         """
-        # set params
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}.")
+
+        # set params (one request for each chunk of unique addresses)
         url = self.url_api_public + "multi_price"
-        params = {
-            "list_address" : ",".join(list_address),
-            "include_liquidity" : str(include_liquidity).lower() if include_liquidity else None
-        }
+        list_address = list(dict.fromkeys(address.strip() for address in list_address))
+        list_params = [
+            {
+                "list_address" : ",".join(list_address[index:index + _PRICE_MULTIPLE_MAX_ADDRESSES])
+            }
+            for index in range(0, max(len(list_address), 1), _PRICE_MULTIPLE_MAX_ADDRESSES)
+        ]
+        if include_liquidity:
+            for params in list_params:
+                params["include_liquidity"] = "true"
+
+        def merge(responses: list[GetPriceMultipleResponse]) -> GetPriceMultipleResponse:
+            if len(responses) == 1:
+                return responses[0]
+            return GetPriceMultipleResponse.model_construct(
+                data = {address: price for response in responses for address, price in response.data.items()},
+                success = all(response.success for response in responses)
+            )
 
         # execute request
         if sync:
-            content_raw = self.client.api(RequestType.GET.value, url, params = params)
-            return GetPriceMultipleResponse(**content_raw.json())
+            def request(params: dict[str, Any]) -> GetPriceMultipleResponse:
+                content_raw = self.client.api(_GET, url, params = params)
+                return GetPriceMultipleResponse.model_validate_json(content_raw.content)
+
+            if len(list_params) == 1:
+                return request(list_params[0])
+
+            # share the same session between the threads
+            self.client.connect()
+            with ThreadPoolExecutor(max_workers = max_concurrency) as executor:
+                return merge(list(executor.map(request, list_params)))
         else:
             async def async_request():
-                content_raw = await self.async_client.api(RequestType.GET.value, url, params = params)
-                return GetPriceMultipleResponse(**content_raw.json())
+                semaphore = asyncio.Semaphore(max_concurrency)
+
+                async def request(params: dict[str, Any]) -> GetPriceMultipleResponse:
+                    async with semaphore:
+                        content_raw = await self.async_client.api(_GET, url, params = params)
+                    return GetPriceMultipleResponse.model_validate_json(content_raw.content)
+
+                return merge(await asyncio.gather(*(request(params) for params in list_params)))
             return async_request()
 
     @overload
@@ -440,8 +598,8 @@ class Birdeye(Interaction):
         address: str,
         address_type: str,
         timeframe: str,
-        dt_from: datetime,
-        dt_to: datetime | None = None
+        dt_from: datetime | int,
+        dt_to: datetime | int | None = None
     ) -> GetPriceHistoricalResponse: ...
 
     @overload
@@ -451,8 +609,8 @@ class Birdeye(Interaction):
         address: str,
         address_type: str,
         timeframe: str,
-        dt_from: datetime,
-        dt_to: datetime | None = None
+        dt_from: datetime | int,
+        dt_to: datetime | int | None = None
     ) -> Coroutine[None, None, GetPriceHistoricalResponse]: ...
 
     def _get_price_historical(
@@ -461,8 +619,8 @@ class Birdeye(Interaction):
         address: str,
         address_type: str,
         timeframe: str,
-        dt_from: datetime,
-        dt_to: datetime | None = None
+        dt_from: datetime | int,
+        dt_to: datetime | int | None = None
     ) -> GetPriceHistoricalResponse | Coroutine[None, None, GetPriceHistoricalResponse]:
         """
             This function refers to the **PUBLIC** API endpoint **[Price - Historical](https://docs.birdeye.so/reference/get_defi-history-price)** and is used 
@@ -477,8 +635,8 @@ class Birdeye(Interaction):
                     The timeframe is used to define intervall between a measure and the next one.
                     The supported chains are available on [`BirdeyeTimeFrame`][cyhole.birdeye.param.BirdeyeTimeFrame].
                     Import them from the library to use the correct identifier.
-                dt_from: beginning time to take take price data.
-                dt_to: end time to take take price data.
+                dt_from: beginning time to take take price data (datetime or unix timestamp).
+                dt_to: end time to take take price data (datetime or unix timestamp).
                     It should be `dt_from` < `dt_to`.
                     If not ptovided (None), the current time is used.
 
@@ -493,12 +651,12 @@ class Birdeye(Interaction):
         BirdeyeAddressType.check(address_type)
         BirdeyeTimeFrame.check(timeframe)
 
-        # set default
-        if dt_to is None:
-            dt_to = datetime.now()
+        # set time window (default: current time)
+        time_from = _to_unix(dt_from)
+        time_to = _to_unix(dt_to) if dt_to is not None else int(time.time())
 
         # check consistency
-        if dt_from > dt_to:
+        if time_from > time_to:
             raise BirdeyeTimeRangeError("Inconsistent timewindow provided: 'dt_from' > 'dt_to'")
 
         # set params
@@ -507,19 +665,18 @@ class Birdeye(Interaction):
             "address" : address,
             "address_type" : address_type,
             "type" : timeframe,
-            "time_from" : int(dt_from.timestamp()),
-            "time_to" : int(dt_to.timestamp())
+            "time_from" : time_from,
+            "time_to" : time_to
         }
 
         # execute request
-        if sync:
-            content_raw = self.client.api(RequestType.GET.value, url, params = params)
-            return GetPriceHistoricalResponse(**content_raw.json())
-        else:
-            async def async_request():
-                content_raw = await self.async_client.api(RequestType.GET.value, url, params = params)
-                return GetPriceHistoricalResponse(**content_raw.json())
-            return async_request()
+        return self.api_return_model(
+            sync = sync,
+            type = _GET,
+            url = url,
+            response_model = GetPriceHistoricalResponse,
+            params = params
+        )
 
     @overload
     def _get_price_volume_single(
@@ -567,14 +724,13 @@ class Birdeye(Interaction):
         }
 
         # execute request
-        if sync:
-            content_raw = self.client.api(RequestType.GET.value, url, params = params)
-            return GetPriceVolumeSingleResponse(**content_raw.json())
-        else:
-            async def async_request():
-                content_raw = await self.async_client.api(RequestType.GET.value, url, params = params)
-                return GetPriceVolumeSingleResponse(**content_raw.json())
-            return async_request()
+        return self.api_return_model(
+            sync = sync,
+            type = _GET,
+            url = url,
+            response_model = GetPriceVolumeSingleResponse,
+            params = params
+        )
 
     @overload
     def _post_price_volume_multi(
@@ -628,14 +784,14 @@ class Birdeye(Interaction):
         }
 
         # execute request
-        if sync:
-            content_raw = self.client.api(RequestType.POST.value, url, json = body, headers = headers)
-            return PostPriceVolumeMultiResponse(**content_raw.json())
-        else:
-            async def async_request():
-                content_raw = await self.async_client.api(RequestType.POST.value, url, json = body, headers = headers)
-                return PostPriceVolumeMultiResponse(**content_raw.json())
-            return async_request()
+        return self.api_return_model(
+            sync = sync,
+            type = _POST,
+            url = url,
+            response_model = PostPriceVolumeMultiResponse,
+            json = body,
+            headers = headers
+        )
 
     @overload
     def _get_trades_token(
@@ -689,22 +845,23 @@ class Birdeye(Interaction):
 
         # set params
         url = self.url_api_private + "txs/token"
-        params = {
+        params: dict[str, Any] = {
             "address" : address,
-            "tx_type" : trade_type,
-            "offset" : offset,
-            "limit": limit
+            "tx_type" : trade_type
         }
+        if offset is not None:
+            params["offset"] = offset
+        if limit is not None:
+            params["limit"] = limit
 
         # execute request
-        if sync:
-            content_raw = self.client.api(RequestType.GET.value, url, params = params)
-            return GetTradesTokenResponse(**content_raw.json())
-        else:
-            async def async_request():
-                content_raw = await self.async_client.api(RequestType.GET.value, url, params = params)
-                return GetTradesTokenResponse(**content_raw.json())
-            return async_request()
+        return self.api_return_model(
+            sync = sync,
+            type = _GET,
+            url = url,
+            response_model = GetTradesTokenResponse,
+            params = params
+        )
 
     @overload
     def _get_trades_pair(
@@ -767,23 +924,24 @@ class Birdeye(Interaction):
 
         # set params
         url = self.url_api_private + "txs/pair"
-        params = {
+        params: dict[str, Any] = {
             "address" : address,
             "tx_type" : trade_type,
-            "sort_type": order_by,
-            "offset" : offset,
-            "limit": limit
+            "sort_type": order_by
         }
+        if offset is not None:
+            params["offset"] = offset
+        if limit is not None:
+            params["limit"] = limit
 
         # execute request
-        if sync:
-            content_raw = self.client.api(RequestType.GET.value, url, params = params)
-            return GetTradesPairResponse(**content_raw.json())
-        else:
-            async def async_request():
-                content_raw = await self.async_client.api(RequestType.GET.value, url, params = params)
-                return GetTradesPairResponse(**content_raw.json())
-            return async_request()
+        return self.api_return_model(
+            sync = sync,
+            type = _GET,
+            url = url,
+            response_model = GetTradesPairResponse,
+            params = params
+        )
 
     @overload
     def _get_ohlcv(
@@ -792,8 +950,8 @@ class Birdeye(Interaction):
             address: str,
             address_type: str,
             timeframe: str,
-            dt_from: datetime,
-            dt_to: datetime | None = None,
+            dt_from: datetime | int,
+            dt_to: datetime | int | None = None,
             chain: str = BirdeyeChain.SOLANA.value
     ) -> GetOHLCVTokenPairResponse: ...
 
@@ -804,8 +962,8 @@ class Birdeye(Interaction):
             address: str,
             address_type: str,
             timeframe: str,
-            dt_from: datetime,
-            dt_to: datetime | None = None,
+            dt_from: datetime | int,
+            dt_to: datetime | int | None = None,
             chain: str = BirdeyeChain.SOLANA.value
     ) -> Coroutine[None, None, GetOHLCVTokenPairResponse]: ...
 
@@ -815,8 +973,8 @@ class Birdeye(Interaction):
             address: str,
             address_type: str,
             timeframe: str,
-            dt_from: datetime,
-            dt_to: datetime | None = None,
+            dt_from: datetime | int,
+            dt_to: datetime | int | None = None,
             chain: str = BirdeyeChain.SOLANA.value
     ) -> GetOHLCVTokenPairResponse | Coroutine[None, None, GetOHLCVTokenPairResponse]:
         """
@@ -832,8 +990,8 @@ class Birdeye(Interaction):
                     The timeframe is used to define intervall between a measure and the next one.
                     The supported chains are available on [`BirdeyeTimeFrame`][cyhole.birdeye.param.BirdeyeTimeFrame].
                     Import them from the library to use the correct identifier.
-                dt_from: beginning time to take take price data.
-                dt_to: end time to take take price data.
+                dt_from: beginning time to take take price data (datetime or unix timestamp).
+                dt_to: end time to take take price data (datetime or unix timestamp).
                     It should be `dt_from` < `dt_to`.
                     If not ptovided (None), the current time is used.
 
@@ -848,12 +1006,12 @@ class Birdeye(Interaction):
         BirdeyeAddressType.check(address_type)
         BirdeyeTimeFrame.check(timeframe)
 
-        # set default
-        if dt_to is None:
-            dt_to = datetime.now()
+        # set time window (default: current time)
+        time_from = _to_unix(dt_from)
+        time_to = _to_unix(dt_to) if dt_to is not None else int(time.time())
 
         # check consistency
-        if dt_from > dt_to:
+        if time_from > time_to:
             raise BirdeyeTimeRangeError("Inconsistent timewindow provided: 'dt_from' > 'dt_to'")
 
         # set params
@@ -863,19 +1021,18 @@ class Birdeye(Interaction):
         params = {
             "address" : address,
             "type" : timeframe,
-            "time_from" : int(dt_from.timestamp()),
-            "time_to" : int(dt_to.timestamp())
+            "time_from" : time_from,
+            "time_to" : time_to
         }
 
         # execute request
-        if sync:
-            content_raw = self.client.api(RequestType.GET.value, url, params = params)
-            return GetOHLCVTokenPairResponse(**content_raw.json())
-        else:
-            async def async_request():
-                content_raw = await self.async_client.api(RequestType.GET.value, url, params = params)
-                return GetOHLCVTokenPairResponse(**content_raw.json())
-            return async_request()
+        return self.api_return_model(
+            sync = sync,
+            type = _GET,
+            url = url,
+            response_model = GetOHLCVTokenPairResponse,
+            params = params
+        )
 
     @overload
     def _get_ohlcv_base_quote(
@@ -884,8 +1041,8 @@ class Birdeye(Interaction):
             base_address: str,
             quote_address: str,
             timeframe: str,
-            dt_from: datetime,
-            dt_to: datetime | None = None,
+            dt_from: datetime | int,
+            dt_to: datetime | int | None = None,
             chain: str = BirdeyeChain.SOLANA.value
     ) -> GetOHLCVBaseQuoteResponse: ...
 
@@ -896,8 +1053,8 @@ class Birdeye(Interaction):
             base_address: str,
             quote_address: str,
             timeframe: str,
-            dt_from: datetime,
-            dt_to: datetime | None = None,
+            dt_from: datetime | int,
+            dt_to: datetime | int | None = None,
             chain: str = BirdeyeChain.SOLANA.value
     ) -> Coroutine[None, None, GetOHLCVBaseQuoteResponse]: ...
 
@@ -907,8 +1064,8 @@ class Birdeye(Interaction):
             base_address: str,
             quote_address: str,
             timeframe: str,
-            dt_from: datetime,
-            dt_to: datetime | None = None,
+            dt_from: datetime | int,
+            dt_to: datetime | int | None = None,
             chain: str = BirdeyeChain.SOLANA.value
     ) -> GetOHLCVBaseQuoteResponse | Coroutine[None, None, GetOHLCVBaseQuoteResponse]:
         """
@@ -923,8 +1080,8 @@ class Birdeye(Interaction):
                     The timeframe is used to define intervall between a measure and the next one.
                     The supported chains are available on [`BirdeyeTimeFrame`][cyhole.birdeye.param.BirdeyeTimeFrame].
                     Import them from the library to use the correct identifier.
-                dt_from: beginning time to take take price data.
-                dt_to: end time to take take price data.
+                dt_from: beginning time to take take price data (datetime or unix timestamp).
+                dt_to: end time to take take price data (datetime or unix timestamp).
                     It should be `dt_from` < `dt_to`.
                     If not ptovided (None), the current time is used.
             Returns:
@@ -937,12 +1094,12 @@ class Birdeye(Interaction):
         # check param consistency
         BirdeyeTimeFrame.check(timeframe)
 
-        # set default
-        if dt_to is None:
-            dt_to = datetime.now()
+        # set time window (default: current time)
+        time_from = _to_unix(dt_from)
+        time_to = _to_unix(dt_to) if dt_to is not None else int(time.time())
 
         # check consistency
-        if dt_from > dt_to:
+        if time_from > time_to:
             raise BirdeyeTimeRangeError("Inconsistent timewindow provided: 'dt_from' > 'dt_to'")
 
         # set params
@@ -951,19 +1108,18 @@ class Birdeye(Interaction):
             "base_address" : base_address,
             "quote_address" : quote_address,
             "type" : timeframe,
-            "time_from" : int(dt_from.timestamp()),
-            "time_to" : int(dt_to.timestamp())
+            "time_from" : time_from,
+            "time_to" : time_to
         }
 
         # execute request
-        if sync:
-            content_raw = self.client.api(RequestType.GET.value, url, params = params)
-            return GetOHLCVBaseQuoteResponse(**content_raw.json())
-        else:
-            async def async_request():
-                content_raw = await self.async_client.api(RequestType.GET.value, url, params = params)
-                return GetOHLCVBaseQuoteResponse(**content_raw.json())
-            return async_request()
+        return self.api_return_model(
+            sync = sync,
+            type = _GET,
+            url = url,
+            response_model = GetOHLCVBaseQuoteResponse,
+            params = params
+        )
 
     @overload
     def _get_wallet_supported_networks(self, sync: Literal[True]) -> GetWalletSupportedNetworksResponse: ...
@@ -985,11 +1141,9 @@ class Birdeye(Interaction):
         url = self.url_api_private_wallet + "/list_supported_chain"
 
         # execute request
-        if sync:
-            content_raw = self.client.api(RequestType.GET.value, url)
-            return GetWalletSupportedNetworksResponse(**content_raw.json())
-        else:
-            async def async_request():
-                content_raw = await self.async_client.api(RequestType.GET.value, url)
-                return GetWalletSupportedNetworksResponse(**content_raw.json())
-            return async_request()
\ No newline at end of file
+        return self.api_return_model(
+            sync = sync,
+            type = _GET,
+            url = url,
+            response_model = GetWalletSupportedNetworksResponse
+        )
\ No newline at end of file
@@ -1,3 +1,4 @@
+from array import array
 from typing import Any
 from datetime import datetime
 
@@ -438,6 +439,15 @@ class GetPriceHistoricalMeasure(BaseModel):
 class GetPriceHistoricalData(BaseModel):
     items: list[GetPriceHistoricalMeasure]
 
+    def to_arrays(self) -> tuple[array, array]:
+        """
+            Get the measures as two typed arrays (unix times, values), 
+            ready for numeric post-processing. The arrays support the buffer 
+            protocol, so they can be wrapped without copies (e.g. `numpy.frombuffer`).
+        """
+        items = self.items
+        return array("q", [item.unix_time for item in items]), array("d", [item.value for item in items])
+
 class GetPriceHistoricalResponse(BaseModel):
     """
         Model used to represent the **Price - Historical** endpoint from birdeye API.
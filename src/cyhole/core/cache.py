@@ -0,0 +1,160 @@
+import os
+import abc
+import json
+import time
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+from collections import OrderedDict
+
+import requests
+
+class Cache(metaclass = abc.ABCMeta):
+    """
+        The following abstract class defines a general cache of the raw content 
+        of the API responses, so that the same request executed again within 
+        a time-to-live is served without calling the external API.
+
+        The entries are identified by a `namespace` (e.g. interaction and endpoint) 
+        and by the MD5 of the URL and of the sorted parameters of the request.
+    """
+    def key(self, url: str, params: dict[str, Any] | None = None) -> str:
+        """
+            Build the key of an entry.
+
+            Parameters:
+                url: URL of the request.
+                params: parameters of the request.
+
+            Returns:
+                MD5 hex digest of the URL and of the sorted parameters.
+        """
+        content = url + json.dumps(params, sort_keys = True, default = str)
+        return hashlib.md5(content.encode()).hexdigest()
+
+    @abc.abstractmethod
+    def get(self, namespace: str, url: str, params: dict[str, Any] | None = None, ttl: float = float("inf")) -> requests.Response | None:
+        """
+            Get the response stored for a request, if still valid.
+
+            Parameters:
+                namespace: group of the entry (e.g. interaction and endpoint).
+                url: URL of the request.
+                params: parameters of the request.
+                ttl: time-to-live of the entry in seconds.
+
+            Returns:
+                The stored response structured as `request` library,
+                or `None` if the entry is not available or expired.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def set(self, namespace: str, url: str, params: dict[str, Any] | None, response: requests.Response) -> None:
+        """
+            Store the response of a request.
+
+            Parameters:
+                namespace: group of the entry (e.g. interaction and endpoint).
+                url: URL of the request.
+                params: parameters of the request.
+                response: response to store.
+        """
+        raise NotImplementedError
+
+    def _to_response(self, url: str, content: bytes) -> requests.Response:
+        """
+            Internal function used to rebuild a response from its stored content.
+        """
+        response = requests.Response()
+        response.url = url
+        response.status_code = 200
+        response.reason = "OK"
+        response.encoding = "utf-8"
+        response._content = content
+        return response
+
+class FileCache(Cache):
+    """
+        This class is used to store on disk the raw content of the API responses.
+
+        Every entry is saved in `{path}/{namespace}/{key}.json`, where `key` is the MD5
+        of the URL and of the sorted parameters of the request, while the time of
+        the entry is the modification time of the file.
+
+        Parameters:
+            path: folder used to store the entries.
+
+        **Example**
+        ```python
+        from cyhole.birdeye import Birdeye
+        from cyhole.core.cache import FileCache
+
+        birdeye = Birdeye(cache = FileCache(".cache"))
+        ```
+    """
+    def __init__(self, path: str | Path = ".cache") -> None:
+        self.path = Path(path)
+        return
+
+    def get(self, namespace: str, url: str, params: dict[str, Any] | None = None, ttl: float = float("inf")) -> requests.Response | None:
+        file = self.path / namespace / f"{self.key(url, params)}.json"
+        try:
+            if time.time() - file.stat().st_mtime >= ttl:
+                return None
+            content = file.read_bytes()
+        except FileNotFoundError:
+            return None
+        return self._to_response(url, content)
+
+    def set(self, namespace: str, url: str, params: dict[str, Any] | None, response: requests.Response) -> None:
+        folder = self.path / namespace
+        folder.mkdir(parents = True, exist_ok = True)
+
+        # write in a temporary file of the same folder and then replace the entry, 
+        # so that a reader never finds a partially written file
+        fd, temp = tempfile.mkstemp(dir = folder, suffix = ".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(response.content)
+            os.replace(temp, folder / f"{self.key(url, params)}.json")
+        except BaseException:
+            os.unlink(temp)
+            raise
+        return
+
+class MemoryCache(Cache):
+    """
+        This class is used to store in memory the raw content of the API responses, 
+        keeping only the most recently used entries. The entries are accessed under 
+        a lock, so the cache can be shared by the threads of the synchronous client.
+
+        Parameters:
+            maxsize: maximum number of entries stored; the least recently used 
+                entry is discarded when the limit is reached.
+    """
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, str], tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        return
+
+    def get(self, namespace: str, url: str, params: dict[str, Any] | None = None, ttl: float = float("inf")) -> requests.Response | None:
+        key = (namespace, self.key(url, params))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.time() - entry[0] >= ttl:
+                return None
+            self._entries.move_to_end(key)
+        return self._to_response(url, entry[1])
+
+    def set(self, namespace: str, url: str, params: dict[str, Any] | None, response: requests.Response) -> None:
+        key = (namespace, self.key(url, params))
+        with self._lock:
+            self._entries[key] = (time.time(), response.content)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last = False)
+        return
\ No newline at end of file
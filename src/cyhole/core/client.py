@@ -5,7 +5,9 @@ import requests
 from typing import Any, Coroutine, TYPE_CHECKING
 
 import aiohttp
+import requests.adapters
 import requests.structures
+from urllib3.util import Retry
 
 from ..core.param import RequestType
 from ..core.exception import (
@@ -63,28 +65,76 @@ class APIClient(APIClientInterface):
         Use this class as middlelayer to manage all the requests to an external API. 
         By default, all new `Interaction` should have the synchronous client that inherits from this class.
 
+        The requests are executed through a `requests.Session` opened on the first call and kept alive 
+        across the calls, so that the underlying connections are reused instead of paying a new 
+        TCP/TLS handshake for each request. The global headers are set once on the session, and 
+        the session is available with `get_session` to customise it (e.g. mount a retry adapter). 
+        The session can be released with `close` or by using the client as a context manager.
+
         During the creation of the object is possible to specify some global configurations.
 
         Parameters:
             headers: headers used globally in all API requests.
+            max_retries: retry policy of the session's HTTPS adapter; it could be the maximum 
+                number of retries on connection errors or a `urllib3.util.Retry` object 
+                (e.g. to retry with backoff the responses with status 429). 
+                By default, the requests are not retried.
     """
-    def __init__(self, interaction: Interaction, headers: Any | None = None) -> None:
+    def __init__(self, interaction: Interaction, headers: Any | None = None, max_retries: int | Retry = 0) -> None:
+        self._session: requests.Session | None = None
         self._interaction = interaction
         self.headers = headers
+        self.max_retries = max_retries
+        return
+
+    def __enter__(self):
+        """Open a new session."""
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """Exits from the session."""
+        self.close()
+        return
+
+    def is_connected(self) -> bool:
+        """Check if the session is available."""
+        return self._session is not None
+
+    def connect(self) -> None:
+        """Init a new session."""
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.mount("https://", requests.adapters.HTTPAdapter(pool_connections = 10, pool_maxsize = 20, max_retries = self.max_retries))
+
+            # set global headers
+            if self.headers:
+                self._session.headers.update(self.headers)
+        return
+
+    def get_session(self) -> requests.Session:
+        """Get the current session, opening a new one if not available."""
+        self.connect()
+        return self._session
+
+    def close(self) -> None:
+        """Close current available session."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
         return
 
     def api(self, type: str, url: str, *args: tuple, **kwargs: dict[str, Any]) -> requests.Response:
 
-        # check for headers
-        if self.headers:
-            kwargs["headers"] = self.headers
+        # reuse the open session
+        self.connect()
 
         # execute request
         match type:
             case RequestType.GET.value:
-                response = requests.get(url, *args, **kwargs)
+                response = self._session.get(url, *args, **kwargs)
             case RequestType.POST.value:
-                response = requests.post(url, *args, **kwargs)
+                response = self._session.post(url, *args, **kwargs)
             case _:
                 raise RequestTypeNotSupported(f"Request '{type}' not supported.")
 
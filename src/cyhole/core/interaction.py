@@ -54,9 +54,9 @@ class Interaction:
         """
         if sync:
             content_raw = self.client.api(type, url, *args, **kwargs)
-            return response_model(**content_raw.json())
+            return response_model.model_validate_json(content_raw.content)
         else:
             async def async_request():
                 content_raw = await self.async_client.api(type, url, *args, **kwargs)
-                return response_model(**content_raw.json())
+                return response_model.model_validate_json(content_raw.content)
             return async_request()
\ No newline at end of file
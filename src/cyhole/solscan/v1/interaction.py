@@ -869,7 +869,7 @@ class Solscan(Interaction):
                 SolscanException: general exception raised when an unknown error is found.
         """
         try:
-            error = SolscanHTTPError(**exception.response.json())
+            error = SolscanHTTPError.model_validate(exception.response.json())
             return SolscanException(f"Code: {error.status}, Message: {error.error.message}")
         except Exception:
             return SolscanException(exception.response.content.decode())
\ No newline at end of file
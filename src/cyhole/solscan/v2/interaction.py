@@ -129,10 +129,7 @@ class Solscan(Interaction):
         """
         # set params
         url = self.base_url + "account/transfer"
-        api_params = params.model_dump(
-            by_alias = True,
-            exclude_defaults = True
-        )
+        api_params = params.to_query()
         api_params["address"] = account
 
         # execute request
@@ -234,10 +231,7 @@ class Solscan(Interaction):
         """
         # set params
         url = self.base_url + "account/defi/activities"
-        api_params = params.model_dump(
-            by_alias = True,
-            exclude_defaults = True
-        )
+        api_params = params.to_query()
         api_params["address"] = account
 
         # execute request
@@ -269,10 +263,7 @@ class Solscan(Interaction):
         """
         # set params
         url = self.base_url + "account/balance_change"
-        api_params = params.model_dump(
-            by_alias = True,
-            exclude_defaults = True
-        )
+        api_params = params.to_query()
         api_params["address"] = account
 
         # execute request
@@ -431,11 +422,11 @@ class Solscan(Interaction):
         # execute request
         if sync:
             content_raw = self.client.api(RequestType.GET.value, url, params = api_params)
-            return GetAccountRewardsExportResponse(csv = content_raw.text)
+            return GetAccountRewardsExportResponse.model_construct(csv = content_raw.text)
         else:
             async def async_request():
                 content_raw = await self.async_client.api(RequestType.GET.value, url, params = api_params)
-                return GetAccountRewardsExportResponse(csv = content_raw.text)
+                return GetAccountRewardsExportResponse.model_construct(csv = content_raw.text)
             return async_request()
 
     @overload
@@ -459,10 +450,7 @@ class Solscan(Interaction):
         """
         # set params
         url = self.base_url + "token/transfer"
-        api_params = params.model_dump(
-            by_alias = True,
-            exclude_defaults = True
-        )
+        api_params = params.to_query()
         api_params["address"] = token
 
         # execute request
@@ -495,10 +483,7 @@ class Solscan(Interaction):
         """
         # set params
         url = self.base_url + "token/defi/activities"
-        api_params = params.model_dump(
-            by_alias = True,
-            exclude_defaults = True
-        )
+        api_params = params.to_query()
         api_params["address"] = token
 
         # execute request
@@ -865,10 +850,7 @@ class Solscan(Interaction):
         """
         # set params
         url = self.base_url + "nft/activities"
-        api_params = params.model_dump(
-            by_alias = True,
-            exclude_defaults = True
-        )
+        api_params = params.to_query()
 
         # execute request
         return  self.api_return_model(
@@ -899,10 +881,7 @@ class Solscan(Interaction):
         """
         # set params
         url = self.base_url + "nft/collection/lists"
-        api_params = params.model_dump(
-            by_alias = True,
-            exclude_defaults = True
-        )
+        api_params = params.to_query()
 
         # execute request
         return  self.api_return_model(
@@ -1170,7 +1149,7 @@ class Solscan(Interaction):
                 SolscanException: general exception raised when an unknown error is found.
         """
         try:
-            error = SolscanHTTPError(**exception.response.json())
+            error = SolscanHTTPError.model_validate_json(exception.response.content)
             return SolscanException(f"Code: {error.errors.code}, Message: {error.errors.message}")
         except Exception:
             return SolscanException(exception.response.content.decode())
\ No newline at end of file
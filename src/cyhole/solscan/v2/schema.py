@@ -1,7 +1,9 @@
-from datetime import datetime
-from typing import TypeAlias
+from datetime import datetime, timedelta, timezone
+from collections.abc import Sequence
+from functools import cached_property, lru_cache
+from typing import Annotated, Any, Callable, ClassVar, Literal, TypeAlias, Union
 
-from pydantic import BaseModel, Field, field_validator, field_serializer
+from pydantic import AliasGenerator, BaseModel, BeforeValidator, ConfigDict, Discriminator, Field, PlainSerializer, Tag, TypeAdapter, computed_field, field_validator
 
 from ...solscan.v2.param import (
     SolscanNFTCollectionPageSizeType,
@@ -14,10 +16,45 @@ from ...solscan.v2.param import (
     SolscanOrderType,
     SolscanFlowType
 )
+from ...core.param import CyholeParam
+from ...core.exception import ParamUnknownError
 from ...solscan.v2.exception import SolscanInvalidAmountRange, SolscanInvalidTimeRange
 
 # General
 
+# keys of the API shared by the records and renamed on the models' fields:
+_RECORD_ALIASES = {
+    "amount_1": "amount1",
+    "amount_2": "amount2",
+    "block_time_unix_utc": "block_time",
+    "created_time_unix_utc": "created_time",
+    "flow_type": "flow",
+    "platform_address": "platform",
+    "previous_block_id": "previous_block_hash",
+    "source_addresses": "sources",
+    "token_1_decimals": "token1_decimals",
+    "token_2_decimals": "token2_decimals"
+}
+
+# configuration shared by the nested models of the records that keep the API keys:
+# the models are never modified after the parsing and unknown keys are dropped.
+_FROZEN_CONFIG = ConfigDict(
+    extra = "ignore",
+    frozen = True
+)
+
+# configuration shared by the models used to parse the records returned by the API:
+# on top of the above, the common keys are renamed by the aliases above.
+_RECORD_CONFIG = ConfigDict(
+    **_FROZEN_CONFIG,
+    populate_by_name = True,
+    alias_generator = AliasGenerator(alias = _RECORD_ALIASES.get)
+)
+
+# configuration of the models used only by rarely called endpoints:
+# the schemas are built on the first validation instead of at import time.
+_DEFERRED_CONFIG = ConfigDict(defer_build = True)
+
 class SolscanBaseResponse(BaseModel):
     """
         Model used to identify the base response of the Solscan API.
@@ -37,36 +74,220 @@ class SolscanHTTPError(SolscanBaseResponse):
     """
     errors: SolscanError
 
-class SolscanTransferParam(BaseModel):
+# admissible values of the params' enums, collected only once at import time:
+_ACTIVITY_TRANSFER_TYPES = frozenset(param.value for param in SolscanActivityTransferType)
+_ACTIVITY_DEFI_TYPES = frozenset(param.value for param in SolscanActivityDefiType)
+_ACTIVITY_NFT_TYPES = frozenset(param.value for param in SolscanActivityNFTType)
+_PAGE_SIZES = frozenset(param.value for param in SolscanPageSizeType)
+_NFT_COLLECTION_PAGE_SIZES = frozenset(param.value for param in SolscanNFTCollectionPageSizeType)
+_NFT_DAYS_RANGES = frozenset(param.value for param in SolscanNFTDaysRangeType)
+_NFT_SORT_TYPES = frozenset(param.value for param in SolscanNFTSortType)
+_ORDER_TYPES = frozenset(param.value for param in SolscanOrderType)
+_FLOW_TYPES = frozenset(param.value for param in SolscanFlowType)
+
+# default page size of the paginated params:
+_DEFAULT_PAGE_SIZE = SolscanPageSizeType.SIZE_10.value
+
+def _check_param(value: Any, param_enum: type[CyholeParam], admissible: frozenset[Any]) -> None:
+    """
+        Internal function used to check a param against the precomputed
+        set of values of the corresponding enum. It works as
+        [`CyholeParam.check`][cyhole.core.param.CyholeParam.check] and
+        raises a `ParamUnknownError` if the value is not supported.
+    """
+    if value not in admissible:
+        raise ParamUnknownError(value, param_enum)
+
+def _check_activity_type(value: list[str] | str | None, param_enum: type[CyholeParam], admissible: frozenset[str]) -> None:
+    """
+        Internal function used to check the activity types of the params
+        against the precomputed set of values of the corresponding enum.
+        It raises a `ParamUnknownError` on the first unsupported value.
+    """
+    value_type = type(value)
+    if value_type is str:
+        _check_param(value, param_enum, admissible)
+    elif value_type is list and not admissible.issuperset(value):
+        for item in value:
+            _check_param(item, param_enum, admissible)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo = timezone.utc)
+_SECOND = timedelta(seconds = 1)
+
+@lru_cache(maxsize = 1024)
+def _to_unix(value: datetime) -> int:
+    """
+        Internal function used to convert a datetime in unix timestamp.
+        The timezone-aware datetimes are converted with a subtraction from the epoch,
+        while the naive ones are still interpreted in local time by `datetime.timestamp`.
+        The results are cached, because the same time ranges are often requested again.
+    """
+    if value.tzinfo is None:
+        return int(value.timestamp())
+    return (value - _EPOCH) // _SECOND
+
+def _from_unix(value: int) -> datetime:
+    """
+        Internal function used to convert a unix timestamp in a datetime in UTC timezone,
+        used by the records to compute their `time` from the block time.
+    """
+    return datetime.fromtimestamp(value, timezone.utc)
+
+# adapter used to parse the time bounds not provided as datetime or unix timestamp (e.g. ISO strings):
+_DATETIME_ADAPTER = TypeAdapter(datetime)
+
+def _time_bound_to_unix(value: Any) -> int:
+    """
+        Internal function used to convert a bound of a time range in unix timestamp.
+        The unix timestamps are kept as they are, while any other value is first
+        validated as a `datetime` (e.g. ISO strings).
+    """
+    if type(value) is int:
+        return value
+    if not isinstance(value, datetime):
+        value = _DATETIME_ADAPTER.validate_python(value)
+    return _to_unix(value)
+
+def _time_range_to_unix(value: Any) -> Any:
+    """
+        Internal function used to convert the `time_range` fields
+        of the params in unix timestamps (from, to) before their validation,
+        so that the ranges are checked and sent without further conversions.
+        Any sequence of two bounds (tuple, list, ...) is accepted.
+    """
+    if isinstance(value, Sequence) and not isinstance(value, (str, bytes)) and len(value) == 2:
+        start, end = value
+        return (_time_bound_to_unix(start), _time_bound_to_unix(end))
+    return value
+
+_BOOL_STR = {True: "true", False: "false"}
+
+def _bool_to_query(value: Any) -> Any:
+    """
+        Internal function used to convert the boolean flags
+        of the params in the `"true"`/`"false"` strings expected by the API.
+    """
+    if isinstance(value, bool):
+        return _BOOL_STR[value]
+    return value
+
+# serialization aliases of the params' fields shared across the endpoints:
+_PARAM_ALIASES = {
+    "activity_type": "activity_type[]",
+    "from_address": "from",
+    "to_address": "to",
+    "token_address": "token",
+    "flow_direction": "flow",
+    "amount_range": "amount[]",
+    "time_range": "block_time[]",
+    "platform_address": "platform[]",
+    "source_address": "source[]",
+    "collection_address": "collection",
+    "currency_token_address": "currency_token",
+    "days_range": "range",
+    "order_by": "sort_order"
+}
+
+class SolscanBaseParam(BaseModel):
+    """
+        Model used to identify the base of the parameters of the Solscan API.
+
+        The serialization aliases of the fields are assigned by name from a shared 
+        map, and a field can still override them with `Field(serialization_alias = ...)`.
+
+        During the creation of every subclass, the fields' serialization aliases, 
+        default values and serializers are collected only once, so that 
+        [`to_query`][cyhole.solscan.v2.schema.SolscanBaseParam.to_query] can 
+        build the query parameters without going through the pydantic serialization.
+    """
+    model_config = ConfigDict(alias_generator = AliasGenerator(serialization_alias = _PARAM_ALIASES.get))
+
+    _query_plan: ClassVar[tuple[tuple[str, str, Any, Callable[[Any], Any] | None], ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        serializers = {
+            field: getattr(cls, serializer.cls_var_name)
+            for serializer in cls.__pydantic_decorators__.field_serializers.values()
+            for field in serializer.info.fields
+        }
+        for name, field in cls.model_fields.items():
+            for metadata in field.metadata:
+                if isinstance(metadata, PlainSerializer):
+                    serializers[name] = metadata.func
+        cls._query_plan = tuple(
+            (name, field.serialization_alias or name, field.default, serializers.get(name))
+            for name, field in cls.model_fields.items()
+        )
+
+    def to_query(self) -> dict[str, Any]:
+        """
+            Build the query parameters of the request. The result is the same of 
+            `model_dump(by_alias = True, exclude_defaults = True)` without the `None` values.
+        """
+        values = self.__dict__
+        return {
+            alias: serializer(value) if serializer else value
+            for name, alias, default, serializer in self._query_plan
+            if (value := values[name]) is not None and value != default
+        }
+
+class _SolscanRangeParam(SolscanBaseParam):
+    """
+        Internal model sharing the `time_range` field and the validators of the paginated
+        params filtered by amount and time ranges. The `page_size` validator is applied
+        only when the field is declared by the subclasses, while the ranges are checked
+        together after the validation of the model.
+    """
+
+    time_range: Annotated[tuple[int, int] | None, BeforeValidator(_time_range_to_unix)] = None
+    """Block times to filter by (from, to), provided as datetimes or unix timestamps."""
+
+    # Validators
+    @field_validator("page_size", check_fields = False)
+    @classmethod
+    def validate_page_size(cls, value: int) -> int:
+        _check_param(value, SolscanPageSizeType, _PAGE_SIZES)
+        return value
+
+    def model_post_init(self, __context: Any) -> None:
+        # the ranges are checked once the fields are validated
+        values = self.__dict__
+        time_range = values["time_range"]
+        if time_range and time_range[0] > time_range[1]:
+            raise SolscanInvalidTimeRange(f"Invalid time range: {time_range}")
+        amount_range = values.get("amount_range")
+        if amount_range and amount_range[0] > amount_range[1]:
+            raise SolscanInvalidAmountRange(f"Invalid amount range: {amount_range}")
+
+class SolscanTransferParam(_SolscanRangeParam):
     """
         Model used to identify the parameters of the Solscan transfer (Account/Token).
     """
 
-    activity_type: str | list[str] | None = Field(default = None, serialization_alias = "activity_type[]")
+    activity_type: str | list[str] | None = None
     """
         Activity type of the account transfer.
         The supported types are available on [`SolscanActivityTransferType`][cyhole.solscan.v2.param.SolscanActivityTransferType].
     """
 
-    from_address: str | None = Field(default = None, serialization_alias = "from")
+    from_address: str | None = None
     """From address to filter."""
 
-    to_address: str | None = Field(default = None, serialization_alias = "to")
+    to_address: str | None = None
     """To address to filter."""
 
-    amount_range: tuple[int, int] | None = Field(default = None, serialization_alias = "amount[]")
+    amount_range: tuple[int, int] | None = None
     """Amount range to filter for the account transfers (from, to)."""
 
-    time_range: tuple[datetime, datetime] | None = Field(default = None, serialization_alias = "block_time[]")
-    """Block times to filter by (from, to)."""
-
-    exclude_amount_zero: bool | None = None
+    exclude_amount_zero: Annotated[Literal["true", "false"] | None, BeforeValidator(_bool_to_query)] = None
     """Exclude transfers with zero amount."""
 
     page: int = Field(default = 1, ge = 1)
     """Page number to get the account transfers."""
 
-    page_size: int = Field(default = SolscanPageSizeType.SIZE_10.value)
+    page_size: int = _DEFAULT_PAGE_SIZE
     """
         Number of account transfers per page. 
         The supported types are available on [`SolscanPageSizeType`][cyhole.solscan.v2.param.SolscanPageSizeType].
@@ -76,90 +297,55 @@ class SolscanTransferParam(BaseModel):
     @field_validator("activity_type")
     @classmethod
     def validate_activity_type(cls, value: list[str] | str | None) -> str | list[str] | None:
-        if isinstance(value, str):
-            SolscanActivityTransferType.check(value)
-        elif isinstance(value, list):
-            for item in value:
-                SolscanActivityTransferType.check(item)
-        return value
-
-    @field_validator("page_size")
-    @classmethod
-    def validate_page_size(cls, value: int) -> int:
-        SolscanPageSizeType.check(value)
+        _check_activity_type(value, SolscanActivityTransferType, _ACTIVITY_TRANSFER_TYPES)
         return value
 
-    @field_validator("amount_range")
-    @classmethod
-    def validate_amount_range(cls, value: tuple[int, int] | None) -> tuple[int, int] | None:
-        if value and value[0] > value[1]:
-            raise SolscanInvalidAmountRange(f"Invalid amount range: {value}")
-        return value
-
-    @field_validator("time_range")
-    @classmethod
-    def validate_time_range(cls, value: tuple[datetime, datetime] | None) -> tuple[datetime, datetime] | None:
-        if value and value[0] > value[1]:
-            raise SolscanInvalidTimeRange(f"Invalid time range: {value}")
-        return value
-
-    # Serializers
-    @field_serializer("time_range")
-    @classmethod
-    def serialize_time_range(cls, value: tuple[datetime, datetime] | None) -> tuple[int, int] | None:
-        if value:
-            return (int(value[0].timestamp()), int(value[1].timestamp()))
-        return
-
-    @field_serializer("exclude_amount_zero")
-    @classmethod
-    def serialize_exclude_amount_zero(cls, value: bool | None) -> str | None:
-        if value is not None:
-            return "true" if value else "false"
-        return
-
 class SolscanTransferData(BaseModel):
     """
         Model used to parse the data of the Solscan transfer (Account/Token).
     """
+    model_config = _RECORD_CONFIG
+
     block_id: int
     transaction_id: str = Field(alias = "trans_id")
-    block_time_unix_utc: int = Field(alias = "block_time")
+    block_time_unix_utc: int
     activity_type: str
     from_address: str
     to_address: str
     token_address: str
     token_decimals: int
     amount: int
-    time: datetime
 
-class SolscanDefiActivitiesParam(BaseModel):
+    @computed_field
+    @cached_property
+    def time(self) -> datetime:
+        """Block time in UTC timezone, computed (on first access) from `block_time_unix_utc`."""
+        return _from_unix(self.block_time_unix_utc)
+
+class SolscanDefiActivitiesParam(_SolscanRangeParam):
     """
         Model used to identify the parameters of the Solscan defi activities (Account/Token).
     """
 
-    activity_type: str | list[str] | None = Field(default = None, serialization_alias = "activity_type[]")
+    activity_type: str | list[str] | None = None
     """
         Activity type of the account defi activities.
         The supported types are available on [`SolscanActivityDefiType`][cyhole.solscan.v2.param.SolscanActivityDefiType].
     """
 
-    from_address: str | None = Field(default = None, serialization_alias = "from")
+    from_address: str | None = None
     """From address to filter."""
 
-    platform_address: str | list[str] | None = Field(default = None, serialization_alias = "platform[]")
+    platform_address: str | list[str] | None = None
     """Platform addresses to filter."""
 
-    source_address: str | list[str] | None = Field(default = None, serialization_alias = "source[]")
+    source_address: str | list[str] | None = None
     """Source addresses to filter."""
 
-    time_range: tuple[datetime, datetime] | None = Field(default = None, serialization_alias = "block_time[]")
-    """Block times to filter by (from, to)."""
-
     page: int = Field(default = 1, ge = 1)
     """Page number to get the account transfers."""
 
-    page_size: int = Field(default = SolscanPageSizeType.SIZE_10.value)
+    page_size: int = _DEFAULT_PAGE_SIZE
     """
         Number of account defi activities per page. 
         The supported types are available on [`SolscanPageSizeType`][cyhole.solscan.v2.param.SolscanPageSizeType].
@@ -168,36 +354,14 @@ class SolscanDefiActivitiesParam(BaseModel):
     @field_validator("activity_type")
     @classmethod
     def validate_activity_type(cls, value: list[str] | str | None) -> str | list[str] | None:
-        if isinstance(value, str):
-            SolscanActivityDefiType.check(value)
-        elif isinstance(value, list):
-            for item in value:
-                SolscanActivityDefiType.check(item)
-        return value
-
-    @field_validator("page_size")
-    @classmethod
-    def validate_page_size(cls, value: int) -> int:
-        SolscanPageSizeType.check(value)
-        return value
-
-    @field_validator("time_range")
-    @classmethod
-    def validate_time_range(cls, value: tuple[datetime, datetime] | None) -> tuple[datetime, datetime] | None:
-        if value and value[0] > value[1]:
-            raise SolscanInvalidTimeRange(f"Invalid time range: {value}")
+        _check_activity_type(value, SolscanActivityDefiType, _ACTIVITY_DEFI_TYPES)
         return value
 
-    @field_serializer("time_range")
-    @classmethod
-    def serialize_time_range(cls, value: tuple[datetime, datetime] | None) -> tuple[int, int] | None:
-        if value:
-            return (int(value[0].timestamp()), int(value[1].timestamp()))
-        return
-
 class SolscanDefiActivitiesChildRoute(BaseModel):
+    model_config = _RECORD_CONFIG
+
     token_1: str = Field(alias = "token1")
-    token_1_decimals: int = Field(alias = "token1_decimals")
+    token_1_decimals: int
     amount_1: int = Field(alias= "amount1")
     token_2: str | None = Field(default = None, alias = "token2")
     token_2_decimals: int | None = Field(default = None, alias = "token2_decimals")
@@ -210,15 +374,22 @@ class SolscanDefiActivitiesData(BaseModel):
     """
         Model used to parse the data of the Solscan defi activities (Account/Token).
     """
+    model_config = _RECORD_CONFIG
+
     block_id: int
     transaction_id: str = Field(alias = "trans_id")
-    block_time_unix_utc: int = Field(alias = "block_time")
+    block_time_unix_utc: int
     activity_type: str
     from_address: str
-    source_addresses: list[str] = Field(alias = "sources")
-    platform_address: str = Field(alias = "platform")
+    source_addresses: list[str]
+    platform_address: str
     routes: list[SolscanDefiActivitiesRoute] | None = None
-    time: datetime
+
+    @computed_field
+    @cached_property
+    def time(self) -> datetime:
+        """Block time in UTC timezone, computed (on first access) from `block_time_unix_utc`."""
+        return _from_unix(self.block_time_unix_utc)
 
 # GET - Account Transfer
 # Param
@@ -230,10 +401,10 @@ class GetAccountTransferParam(SolscanTransferParam):
     token_account: str | None = None
     """Token account address to filter."""
 
-    token_address: str | None = Field(default = None, serialization_alias = "token")
+    token_address: str | None = None
     """Token address to filter."""
 
-    flow_direction: str | None = Field(default = None, serialization_alias = "flow")
+    flow_direction: str | None = None
     """
         Flow direction to filter.
         The supported types are available on [`SolscanFlowType`][cyhole.solscan.v2.param.SolscanFlowType].
@@ -245,7 +416,7 @@ class GetAccountTransferParam(SolscanTransferParam):
     @classmethod
     def validate_flow_direction(cls, value: str | None) -> str | None:
         if value:
-            SolscanFlowType.check(value)
+            _check_param(value, SolscanFlowType, _FLOW_TYPES)
         return value
 
 # Response
@@ -253,7 +424,7 @@ class GetAccountTransferData(SolscanTransferData):
     """
         Model used to parse the data of the GET **[Account Transfer](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-account-transfer)** of **V2** API endpoint.
     """
-    flow_type: str = Field(alias = "flow")
+    flow_type: str
 
 class GetAccountTransferResponse(SolscanBaseResponse):
     """
@@ -266,6 +437,8 @@ class GetAccountTokenNFTAccountData(BaseModel):
     """
         Model used to parse the data of the GET **[Account Token/NFT Account](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-account-token-accounts)** of **V2** API endpoint.
     """
+    model_config = _RECORD_CONFIG
+
     token_account: str
     token_address: str
     amount: int
@@ -280,18 +453,18 @@ class GetAccountTokenNFTAccountResponse(SolscanBaseResponse):
 
 # GET - Account Defi Activities
 # Param
-class GetAccountDefiActivitiesParam(SolscanDefiActivitiesParam):
-    """
-        Model used to identify the parameters of the GET **[Account Defi Activities](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-account-defi-activities)** of **V2** API endpoint.
-    """
-    pass
+GetAccountDefiActivitiesParam: TypeAlias = SolscanDefiActivitiesParam
+"""
+    Model used to identify the parameters of the GET **[Account Defi Activities](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-account-defi-activities)** of **V2** API endpoint.
+    The endpoint does not add any parameter, so the model is an alias of `SolscanDefiActivitiesParam`.
+"""
 
 # Response
-class GetAccountDefiActivitiesData(SolscanDefiActivitiesData):
-    """
-        Model used to parse the data of the GET **[Account Defi Activities](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-account-defi-activities)** of **V2** API endpoint.
-    """
-    pass
+GetAccountDefiActivitiesData: TypeAlias = SolscanDefiActivitiesData
+"""
+    Model used to parse the data of the GET **[Account Defi Activities](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-account-defi-activities)** of **V2** API endpoint.
+    The endpoint does not add any field, so the model is an alias of `SolscanDefiActivitiesData`.
+"""
 
 class GetAccountDefiActivitiesResponse(SolscanBaseResponse):
     """
@@ -301,24 +474,21 @@ class GetAccountDefiActivitiesResponse(SolscanBaseResponse):
 
 # GET - Account Balance Change Activities
 # Param
-class GetAccountBalanceChangeActivitiesParam(BaseModel):
+class GetAccountBalanceChangeActivitiesParam(_SolscanRangeParam):
     """
         Model used to identify the parameters of the GET **[Account Balance Change Activities](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-account-balance_change)** of **V2** API endpoint.
     """
 
-    token_address: str | None = Field(default = None, serialization_alias = "token")
+    token_address: str | None = None
     """Token address to filter."""
 
-    time_range: tuple[datetime, datetime] | None = Field(default = None, serialization_alias = "block_time[]")
-    """Block times to filter by (from, to)."""
-
-    remove_spam: bool | None = None
+    remove_spam: Annotated[Literal["true", "false"] | None, BeforeValidator(_bool_to_query)] = None
     """The query parameter to determine if spam activities have been removed or not."""
 
-    amount_range: tuple[int, int] | None = Field(default = None, serialization_alias = "amount[]")
+    amount_range: tuple[int, int] | None = None
     """Amount range to filter for the account transfers (from, to)."""
 
-    flow_direction: str | None = Field(default = None, serialization_alias = "flow")
+    flow_direction: str | None = None
     """
         Flow direction to filter.
         The supported types are available on [`SolscanFlowType`][cyhole.solscan.v2.param.SolscanFlowType].
@@ -327,7 +497,7 @@ class GetAccountBalanceChangeActivitiesParam(BaseModel):
     page: int = Field(default = 1, ge = 1)
     """Page number to get the account transfers."""
 
-    page_size: int = Field(default = SolscanPageSizeType.SIZE_10.value)
+    page_size: int = _DEFAULT_PAGE_SIZE
     """
         Number of account balance change activities per page. 
         The supported types are available on [`SolscanPageSizeType`][cyhole.solscan.v2.param.SolscanPageSizeType].
@@ -338,51 +508,18 @@ class GetAccountBalanceChangeActivitiesParam(BaseModel):
     @classmethod
     def validate_flow_direction(cls, value: str | None) -> str | None:
         if value:
-            SolscanFlowType.check(value)
-        return value
-
-    @field_validator("amount_range")
-    @classmethod
-    def validate_amount_range(cls, value: tuple[int, int] | None) -> tuple[int, int] | None:
-        if value and value[0] > value[1]:
-            raise SolscanInvalidAmountRange(f"Invalid amount range: {value}")
-        return value
-
-    @field_validator("page_size")
-    @classmethod
-    def validate_page_size(cls, value: int) -> int:
-        SolscanPageSizeType.check(value)
-        return value
-
-    @field_validator("time_range")
-    @classmethod
-    def validate_time_range(cls, value: tuple[datetime, datetime] | None) -> tuple[datetime, datetime] | None:
-        if value and value[0] > value[1]:
-            raise SolscanInvalidTimeRange(f"Invalid time range: {value}")
+            _check_param(value, SolscanFlowType, _FLOW_TYPES)
         return value
 
-    # Serializers
-    @field_serializer("time_range")
-    @classmethod
-    def serialize_time_range(cls, value: tuple[datetime, datetime] | None) -> tuple[int, int] | None:
-        if value:
-            return (int(value[0].timestamp()), int(value[1].timestamp()))
-        return
-
-    @field_serializer("remove_spam")
-    @classmethod
-    def serialize_remove_spam(cls, value: bool | None) -> str | None:
-        if value is not None:
-            return "true" if value else "false"
-        return
-
 # Response
 class GetAccountBalanceChangeActivitiesData(BaseModel):
     """
         Model used to parse the data of the GET **[Account Balance Change Activities](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-account-balance_change)** of **V2** API endpoint.
     """
+    model_config = _RECORD_CONFIG
+
     block_id: int
-    block_time_unix_utc: int = Field(alias = "block_time")
+    block_time_unix_utc: int
     transaction_id: str = Field(alias = "trans_id")
     address: str
     token_address: str
@@ -393,7 +530,12 @@ class GetAccountBalanceChangeActivitiesData(BaseModel):
     post_balance: int
     change_type: str
     fee: int
-    time: datetime
+
+    @computed_field
+    @cached_property
+    def time(self) -> datetime:
+        """Block time in UTC timezone, computed (on first access) from `block_time_unix_utc`."""
+        return _from_unix(self.block_time_unix_utc)
 
 class GetAccountBalanceChangeActivitiesResponse(SolscanBaseResponse):
     """
@@ -407,6 +549,8 @@ class GetAccountTransactionsInstruction(BaseModel):
     """
         Model used to parse the instructions of the GET **[Account Transactions](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-account-transactions)** of **V2** API endpoint.
     """
+    model_config = _RECORD_CONFIG
+
     type: str
     program: str
     program_id: str
@@ -415,15 +559,22 @@ class GetAccountTransactionsData(BaseModel):
     """
         Model used to parse the data of the GET **[Account Transactions](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-account-transactions)** of **V2** API endpoint.
     """
+    model_config = _RECORD_CONFIG
+
     slot: int
     fee: int
     status: str
     signer: list[str]
-    block_time_unix_utc: int = Field(alias = "block_time")
+    block_time_unix_utc: int
     transaction_id: str = Field(alias = "tx_hash")
     parsed_instructions: list[GetAccountTransactionsInstruction]
     program_ids: list[str]
-    time: datetime
+
+    @computed_field
+    @cached_property
+    def time(self) -> datetime:
+        """Block time in UTC timezone, computed (on first access) from `block_time_unix_utc`."""
+        return _from_unix(self.block_time_unix_utc)
 
 class GetAccountTransactionsResponse(SolscanBaseResponse):
     """
@@ -437,6 +588,8 @@ class GetAccountStakeData(BaseModel):
     """
         Model used to parse the data of the GET **[Account Stake](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-account-stake)** of **V2** API endpoint.
     """
+    model_config = _RECORD_CONFIG
+
     amount: int
     role: list[str]
     status: str
@@ -462,6 +615,8 @@ class GetAccountDetailData(BaseModel):
     """
         Model used to parse the data of the GET **[Account Detail](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-account-detail)** of **V2** API endpoint.
     """
+    model_config = _RECORD_CONFIG
+
     account: str
     lamports: int
     type: str
@@ -485,18 +640,18 @@ class GetAccountRewardsExportResponse(BaseModel):
 
 # GET - Token Transfer
 # Param
-class GetTokenTransferParam(SolscanTransferParam):
-    """
-        Model used to identify the parameters of the GET **[Token Transfer](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-token-transfer)** of **V2** API endpoint.
-    """
-    pass
+GetTokenTransferParam: TypeAlias = SolscanTransferParam
+"""
+    Model used to identify the parameters of the GET **[Token Transfer](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-token-transfer)** of **V2** API endpoint.
+    The endpoint does not add any parameter, so the model is an alias of `SolscanTransferParam`.
+"""
 
 # Response
-class GetTokenTransferData(SolscanTransferData):
-    """
-        Model used to parse the data of the GET **[Token Transfer](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-token-transfer)** of **V2** API endpoint.
-    """
-    pass
+GetTokenTransferData: TypeAlias = SolscanTransferData
+"""
+    Model used to parse the data of the GET **[Token Transfer](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-token-transfer)** of **V2** API endpoint.
+    The endpoint does not add any field, so the model is an alias of `SolscanTransferData`.
+"""
 
 class GetTokenTransferResponse(SolscanBaseResponse):
     """
@@ -511,15 +666,15 @@ class GetTokenDefiActivitiesParam(SolscanDefiActivitiesParam):
         Model used to identify the parameters of the GET **[Token Defi Activities](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-token-defi-activities)** of **V2** API endpoint.
     """
 
-    token_address: str | None = Field(default = None, serialization_alias = "token")
+    token_address: str | None = None
     """Token address to filter."""
 
 # Response
-class GetTokenDefiActivitiesData(SolscanDefiActivitiesData):
-    """
-        Model used to parse the data of the GET **[Token Defi Activities](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-token-defi-activities)** of **V2** API endpoint.
-    """
-    pass
+GetTokenDefiActivitiesData: TypeAlias = SolscanDefiActivitiesData
+"""
+    Model used to parse the data of the GET **[Token Defi Activities](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-token-defi-activities)** of **V2** API endpoint.
+    The endpoint does not add any field, so the model is an alias of `SolscanDefiActivitiesData`.
+"""
 
 class GetTokenDefiActivitiesResponse(SolscanBaseResponse):
     """
@@ -533,6 +688,8 @@ class GetTokenMarketsData(BaseModel):
     """
         Model used to parse the data of the GET **[Token Markets](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-token-markets)** of **V2** API endpoint.
     """
+    model_config = _RECORD_CONFIG
+
     pool_id: str
     program_id: str
     token_1: str
@@ -556,6 +713,8 @@ class GetTokenListData(BaseModel):
     """
         Model used to parse the data of the GET **[Token List](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-token-list)** of **V2** API endpoint.
     """
+    model_config = _RECORD_CONFIG
+
     address: str
     decimals: int
     name: str | None = None
@@ -578,6 +737,8 @@ class GetTokenTrendingData(BaseModel):
     """
         Model used to parse the data of the GET **[Token Trending](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-token-trending)** of **V2** API endpoint.
     """
+    model_config = _RECORD_CONFIG
+
     address: str
     decimals: int
     name: str | None = None
@@ -591,24 +752,35 @@ class GetTokenTrendingResponse(SolscanBaseResponse):
 
 # GET - Token Price
 # Response
+def _parse_price_date(value: Any) -> datetime:
+    """
+        Internal function used to convert the `YYYYMMDD` integer
+        dates returned by the Token Price endpoint in datetimes.
+        Datetimes are returned unchanged.
+    """
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise ValueError(f"invalid date {value!r}, expected a YYYYMMDD integer or a datetime")
+    year, month_day = divmod(int(value), 10000)
+    month, day = divmod(month_day, 100)
+    return datetime(year, month, day)
+
+def _serialize_price_date(value: datetime) -> int:
+    """
+        Internal function used to convert back the datetimes
+        of the Token Price endpoint in `YYYYMMDD` integers.
+    """
+    return value.year * 10000 + value.month * 100 + value.day
+
 class GetTokenPriceData(BaseModel):
     """
         Model used to parse the data of the GET **[Token Price](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-token-price)** of **V2** API endpoint.
     """
-    date: datetime = Field(strict = True)
-    price: float
+    model_config = _RECORD_CONFIG
 
-    # Validators
-    @field_validator("date", mode = "before")
-    @classmethod
-    def validate_date(cls, value: int) -> datetime:
-        return datetime.strptime(str(value), "%Y%m%d")
-
-    # Serializers
-    @field_serializer("date")
-    @classmethod
-    def serialize_date(cls, value: datetime) -> int:
-        return int(value.strftime("%Y%m%d"))
+    date: Annotated[datetime, BeforeValidator(_parse_price_date), PlainSerializer(_serialize_price_date)] = Field(strict = True)
+    price: float
 
 class GetTokenPriceResponse(SolscanBaseResponse):
     """
@@ -622,6 +794,8 @@ class GetTokenHoldersHolder(BaseModel):
     """
         Model used to parse the holder data of the GET **[Token Holders](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-token-holders)** of **V2** API endpoint.
     """
+    model_config = _RECORD_CONFIG
+
     address: str
     amount: int
     decimals: int
@@ -669,27 +843,39 @@ class GetTokenMetaResponse(SolscanBaseResponse):
 # GET - NFT News
 # Response
 class GetNFTNewsNftInfoMetaAttribute(BaseModel):
+    model_config = _DEFERRED_CONFIG
+
     trait_type: str
     value: str | int
 
 class GetNFTNewsNftInfoMetaCollection(BaseModel):
+    model_config = _DEFERRED_CONFIG
+
     name: str
     family: str
 
 class GetNFTNewsNftInfoMetaFile(BaseModel):
+    model_config = _DEFERRED_CONFIG
+
     uri: str
     type: str
 
 class GetNFTNewsNftInfoMetaCreator(BaseModel):
+    model_config = _DEFERRED_CONFIG
+
     address: str
     share: int
 
 class GetNFTNewsNftInfoMetaProperty(BaseModel):
+    model_config = _DEFERRED_CONFIG
+
     files: list[GetNFTNewsNftInfoMetaFile]
     category: str | None = None
     creators: list[GetNFTNewsNftInfoMetaCreator] | None = None
 
 class GetNFTNewsNftInfoMeta(BaseModel):
+    model_config = _DEFERRED_CONFIG
+
     name: str
     symbol: str | None = None
     description: str
@@ -709,11 +895,15 @@ class GetNFTNewsNftInfoMeta(BaseModel):
     process_video: str | None = Field(default = None, alias = "processVideo")
 
 class GetNFTNewsNftInfoDataCreator(BaseModel):
+    model_config = _DEFERRED_CONFIG
+
     address: str
     verified: int
     share: int
 
 class GetNFTNewsNftInfoData(BaseModel):
+    model_config = _DEFERRED_CONFIG
+
     name: str
     symbol: str
     uri: str
@@ -722,6 +912,8 @@ class GetNFTNewsNftInfoData(BaseModel):
     id: int
 
 class GetNFTNewsNftInfo(BaseModel):
+    model_config = _DEFERRED_CONFIG
+
     address: str
     created_time_unix_utc: int = Field(alias = "createdTime")
     mint_transaction: str = Field(alias = "mintTx")
@@ -732,12 +924,16 @@ class GetNFTNewsNftInfo(BaseModel):
     meta: GetNFTNewsNftInfoMeta
 
 class GetNFTNewsNft(BaseModel):
+    model_config = _DEFERRED_CONFIG
+
     info: GetNFTNewsNftInfo
 
 class GetNFTNewsData(BaseModel):
     """
         Model used to parse the data of the GET **[NFT News](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-nft-news)** of **V2** API endpoint.
     """
+    model_config = _DEFERRED_CONFIG
+
     nfts: list[GetNFTNewsNft] = Field(alias = "data")
     total: int
 
@@ -745,49 +941,48 @@ class GetNFTNewsResponse(SolscanBaseResponse):
     """
         Model used to parse the response of the GET **[NFT News](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-nft-news)** of **V2** API endpoint.
     """
+    model_config = _DEFERRED_CONFIG
+
     data: GetNFTNewsData
 
 # GET - NFT Activities
 # Param
-class GetNFTActivitiesParam(BaseModel):
+class GetNFTActivitiesParam(_SolscanRangeParam):
     """
         Model used to identify the parameters of the GET **[NFT Activities](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-nft-activities)** of **V2** API endpoint.
     """
 
-    from_address: str | None = Field(default = None, serialization_alias = "from")
+    from_address: str | None = None
     """From address to filter."""
 
-    to_address: str | None = Field(default = None, serialization_alias = "to")
+    to_address: str | None = None
     """To address to filter."""
 
-    source_address: str | list[str] | None = Field(default = None, serialization_alias = "source[]")
+    source_address: str | list[str] | None = None
     """Source addresses to filter."""
 
-    activity_type: str | list[str] | None = Field(default = None, serialization_alias = "activity_type[]")
+    activity_type: str | list[str] | None = None
     """
         Activity type of the NFT activities.
         The supported types are available on [`SolscanActivityNFTType`][cyhole.solscan.v2.param.SolscanActivityNFTType].
     """
 
-    token_address: str | None = Field(default = None, serialization_alias = "token")
+    token_address: str | None = None
     """Token address to filter."""
 
-    collection_address: str | None = Field(default = None, serialization_alias = "collection")
+    collection_address: str | None = None
     """Collection address to filter."""
 
-    currency_token_address: str | None = Field(default = None, serialization_alias = "currency_token")
+    currency_token_address: str | None = None
     """Currency token address to filter."""
 
     amount_range: tuple[int, int] | None = Field(default = None, serialization_alias = "price[]")
     """Amount range to filter for the NFT activities (from, to)."""
 
-    time_range: tuple[datetime, datetime] | None = Field(default = None, serialization_alias = "block_time[]")
-    """Block times to filter by (from, to)."""
-
     page: int = Field(default = 1, ge = 1)
     """Page number to get the NFT activities."""
 
-    page_size: int = Field(default = SolscanPageSizeType.SIZE_10.value)
+    page_size: int = _DEFAULT_PAGE_SIZE
     """
         Number of NFT activities per page. 
         The supported types are available on [`SolscanPageSizeType`][cyhole.solscan.v2.param.SolscanPageSizeType].
@@ -797,49 +992,19 @@ class GetNFTActivitiesParam(BaseModel):
     @field_validator("activity_type")
     @classmethod
     def validate_activity_type(cls, value: list[str] | str | None) -> str | list[str] | None:
-        if isinstance(value, str):
-            SolscanActivityNFTType.check(value)
-        elif isinstance(value, list):
-            for item in value:
-                SolscanActivityNFTType.check(item)
+        _check_activity_type(value, SolscanActivityNFTType, _ACTIVITY_NFT_TYPES)
         return value
 
-    @field_validator("amount_range")
-    @classmethod
-    def validate_amount_range(cls, value: tuple[int, int] | None) -> tuple[int, int] | None:
-        if value and value[0] > value[1]:
-            raise SolscanInvalidAmountRange(f"Invalid amount range: {value}")
-        return value
-
-    @field_validator("page_size")
-    @classmethod
-    def validate_page_size(cls, value: int) -> int:
-        SolscanPageSizeType.check(value)
-        return value
-
-    @field_validator("time_range")
-    @classmethod
-    def validate_time_range(cls, value: tuple[datetime, datetime] | None) -> tuple[datetime, datetime] | None:
-        if value and value[0] > value[1]:
-            raise SolscanInvalidTimeRange(f"Invalid time range: {value}")
-        return value
-
-    # Serializers
-    @field_serializer("time_range")
-    @classmethod
-    def serialize_time_range(cls, value: tuple[datetime, datetime] | None) -> tuple[int, int] | None:
-        if value:
-            return (int(value[0].timestamp()), int(value[1].timestamp()))
-        return
-
 # Response
 class GetNFTActivitiesData(BaseModel):
     """
         Model used to parse the data of the GET **[NFT Activities](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-nft-activities)** of **V2** API endpoint.
     """
+    model_config = _RECORD_CONFIG
+
     block_id: int
     transaction_id: str = Field(alias = "trans_id")
-    block_time_unix_utc: int = Field(alias = "block_time")
+    block_time_unix_utc: int
     activity_type: str
     from_address: str
     to_address: str
@@ -850,7 +1015,12 @@ class GetNFTActivitiesData(BaseModel):
     price: int
     currency_token: str
     currency_decimals: int
-    time: datetime
+
+    @computed_field
+    @cached_property
+    def time(self) -> datetime:
+        """Block time in UTC timezone, computed (on first access) from `block_time_unix_utc`."""
+        return _from_unix(self.block_time_unix_utc)
 
 class GetNFTActivitiesResponse(SolscanBaseResponse):
     """
@@ -860,24 +1030,24 @@ class GetNFTActivitiesResponse(SolscanBaseResponse):
 
 # GET - NFT Collection Lists
 # Param
-class GetNFTCollectionListsParam(BaseModel):
+class GetNFTCollectionListsParam(SolscanBaseParam):
     """
         Model used to identify the parameters of the GET **[NFT Collection Lists](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-nft-collection-lists)** of **V2** API endpoint.
     """
 
-    days_range: int | None = Field(default = None, serialization_alias = "range")
+    days_range: int | None = None
     """
         Number of days to filter the NFT collection lists.
         The supported types are available on [`SolscanNFTDaysRangeType`][cyhole.solscan.v2.param.SolscanNFTDaysRangeType].
     """
 
-    order_by: str | None = Field(default = None, serialization_alias = "sort_order")
+    order_by: str | None = None
     """
         Order by to filter the NFT collection lists.
         The supported types are available on [`SolscanOrderType`][cyhole.solscan.v2.param.SolscanOrderType].
     """
 
-    sort_by: str | None = Field(default = None, serialization_alias = "sort_by")
+    sort_by: str | None = None
     """
         Sort by to filter the NFT collection lists.
         The supported types are available on [`SolscanNFTSortType`][cyhole.solscan.v2.param.SolscanNFTSortType].
@@ -886,13 +1056,13 @@ class GetNFTCollectionListsParam(BaseModel):
     page: int = Field(default = 1, ge = 1)
     """Page number to get the NFT collection lists."""
 
-    page_size: int = Field(default = SolscanPageSizeType.SIZE_10.value)
+    page_size: int = _DEFAULT_PAGE_SIZE
     """
         Number of NFT activities per page. 
         The supported types are available on [`SolscanNFTCollectionPageSizeType`][cyhole.solscan.v2.param.SolscanNFTCollectionPageSizeType].
     """
 
-    collection_address: str | None = Field(default = None, serialization_alias = "collection")
+    collection_address: str | None = None
     """Collection address to filter."""
 
     # Validators
@@ -900,27 +1070,27 @@ class GetNFTCollectionListsParam(BaseModel):
     @classmethod
     def validate_days_range(cls, value: int | None) -> int | None:
         if value:
-            SolscanNFTDaysRangeType.check(value)
+            _check_param(value, SolscanNFTDaysRangeType, _NFT_DAYS_RANGES)
         return value
 
     @field_validator("order_by")
     @classmethod
     def validate_order_by(cls, value: str | None) -> str | None:
         if value:
-            SolscanOrderType.check(value)
+            _check_param(value, SolscanOrderType, _ORDER_TYPES)
         return value
 
     @field_validator("sort_by")
     @classmethod
     def validate_sort_by(cls, value: str | None) -> str | None:
         if value:
-            SolscanNFTSortType.check(value)
+            _check_param(value, SolscanNFTSortType, _NFT_SORT_TYPES)
         return value
 
     @field_validator("page_size")
     @classmethod
     def validate_page_size(cls, value: int) -> int:
-        SolscanNFTCollectionPageSizeType.check(value)
+        _check_param(value, SolscanNFTCollectionPageSizeType, _NFT_COLLECTION_PAGE_SIZES)
         return value
 
 # Response
@@ -928,6 +1098,8 @@ class GetNFTCollectionListsData(BaseModel):
     """
         Model used to parse the data of the GET **[NFT Collection Lists](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-nft-collection-lists)** of **V2** API endpoint.
     """
+    model_config = _RECORD_CONFIG
+
     collection_address: str = Field(alias = "collection_id")
     floor_price: float
     items: int
@@ -943,11 +1115,17 @@ class GetNFTCollectionListsResponse(SolscanBaseResponse):
 
 # GET - NFT Collection Items
 # Response
-class GetNFTCollectionItemData(GetNFTNewsNftInfoData):
-    pass
-
-class GetNFTCollectionItemMeta(GetNFTNewsNftInfoMeta):
-    pass
+GetNFTCollectionItemData: TypeAlias = GetNFTNewsNftInfoData
+"""
+    Model used to parse the NFT data of the GET **[NFT Collection Items](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-nft-collection-items)** of **V2** API endpoint.
+    The model is an alias of `GetNFTNewsNftInfoData`.
+"""
+
+GetNFTCollectionItemMeta: TypeAlias = GetNFTNewsNftInfoMeta
+"""
+    Model used to parse the NFT metadata of the GET **[NFT Collection Items](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-nft-collection-items)** of **V2** API endpoint.
+    The model is an alias of `GetNFTNewsNftInfoMeta`.
+"""
 
 class GetNFTCollectionItemInfo(BaseModel):
     address: str
@@ -972,6 +1150,8 @@ class GetNFTCollectionItemsData(BaseModel):
     """
         Model used to parse the data of the GET **[NFT Collection Items](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-nft-collection-items)** of **V2** API endpoint.
     """
+    model_config = _RECORD_CONFIG
+
     info: GetNFTCollectionItemInfo
     stats: GetNFTCollectionItemStats
 
@@ -983,22 +1163,32 @@ class GetNFTCollectionItemsResponse(SolscanBaseResponse):
 
 # GET - Transaction Last
 # Response
-class GetTransactionLastInstruction(GetAccountTransactionsInstruction):
-    pass
+GetTransactionLastInstruction: TypeAlias = GetAccountTransactionsInstruction
+"""
+    Model used to parse the instructions of the GET **[Transaction Last](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-transaction-last)** of **V2** API endpoint.
+    The model is an alias of `GetAccountTransactionsInstruction`.
+"""
 
 class GetTransactionLastData(BaseModel):
     """
         Model used to parse the data of the GET **[Transaction Last](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-transaction-last)** of **V2** API endpoint.
     """
+    model_config = _RECORD_CONFIG
+
     slot: int
     fee: int
     status: str
     signer: list[str]
-    block_time_unix_utc: int = Field(alias = "block_time")
+    block_time_unix_utc: int
     transaction_id: str = Field(alias = "tx_hash")
     parsed_instructions: list[GetTransactionLastInstruction]
     program_ids: list[str]
-    time: datetime
+
+    @computed_field
+    @cached_property
+    def time(self) -> datetime:
+        """Block time in UTC timezone, computed (on first access) from `block_time_unix_utc`."""
+        return _from_unix(self.block_time_unix_utc)
 
 class GetTransactionLastResponse(SolscanBaseResponse):
     """
@@ -1009,6 +1199,8 @@ class GetTransactionLastResponse(SolscanBaseResponse):
 # GET - Transaction Actions
 # Response
 class GetTransactionActionsTransfer(BaseModel):
+    model_config = _FROZEN_CONFIG
+
     source_owner: str | None = None
     source: str | None = None
     destination_owner: str | None = None
@@ -1024,6 +1216,8 @@ class GetTransactionActionsTransfer(BaseModel):
     outer_ins_index: int
 
 class GetTransactionActionsActivityDataRouter(BaseModel):
+    model_config = _FROZEN_CONFIG
+
     amm_program_id: str
     token_1: str
     token_decimal_1: int
@@ -1036,14 +1230,20 @@ class GetTransactionActionsActivityDataRouter(BaseModel):
 
 # Data Unit Limit
 class GetTransactionActionsActivityDataUnitLimit(BaseModel):
+    model_config = _FROZEN_CONFIG
+
     compute_unit_limit: str
 
 # Data Unit Price
 class GetTransactionActionsActivityDataUnitPrice(BaseModel):
+    model_config = _FROZEN_CONFIG
+
     compute_unit_price_by_microlamport: str
 
 # Data Spl Common
 class GetTransactionActionsActivityDataSplCommon(BaseModel):
+    model_config = _FROZEN_CONFIG
+
     amount: int | None = None
     amount_str: str | None = None
     token_address: str
@@ -1057,6 +1257,8 @@ class GetTransactionActionsActivityDataSplCommon(BaseModel):
 
 # Data Spl Mint/Burn
 class GetTransactionActionsActivityDataSplMintBurn(BaseModel):
+    model_config = _FROZEN_CONFIG
+
     account: str
     authority: str
     token_address: str
@@ -1066,6 +1268,8 @@ class GetTransactionActionsActivityDataSplMintBurn(BaseModel):
 
 # Data Token Swap
 class GetTransactionActionsActivityDataTokenSwap(BaseModel):
+    model_config = _FROZEN_CONFIG
+
     amm_id: str
     amm_authoriy: str | None = None
     account: str
@@ -1091,6 +1295,8 @@ class GetTransactionActionsActivityDataTokenSwap(BaseModel):
 
 # Data Create Account
 class GetTransactionActionsActivityDataCreateAccount(BaseModel):
+    model_config = _FROZEN_CONFIG
+
     new_account: str
     source: str
     transfer_amount: int
@@ -1099,16 +1305,61 @@ class GetTransactionActionsActivityDataCreateAccount(BaseModel):
     space: int
     common_type: str
 
+# Data Discriminator
+def _required_keys(model: type[BaseModel]) -> frozenset[str]:
+    """
+        Internal function used to collect the keys that must
+        be in a payload for it to be validated by `model`.
+    """
+    return frozenset(field.alias or name for name, field in model.model_fields.items() if field.is_required())
+
+# the models are checked in order, the first one whose required keys are all
+# in the payload is selected, otherwise the payload is parsed as SPL common
+_ACTIVITY_DATA_KEYS: tuple[tuple[str, frozenset[str]], ...] = (
+    ("unit_price", _required_keys(GetTransactionActionsActivityDataUnitPrice)),
+    ("unit_limit", _required_keys(GetTransactionActionsActivityDataUnitLimit)),
+    ("token_swap", _required_keys(GetTransactionActionsActivityDataTokenSwap)),
+    ("create_account", _required_keys(GetTransactionActionsActivityDataCreateAccount)),
+    ("spl_mint_burn", _required_keys(GetTransactionActionsActivityDataSplMintBurn))
+)
+
+def _get_activity_data_tag(value: Any) -> str:
+    """
+        Internal function used to identify the model of the data of a transaction
+        activity from its keys, so that only the matching model is validated.
+    """
+    if isinstance(value, BaseModel):
+        return _ACTIVITY_DATA_TAGS.get(type(value), "spl_common")
+    for tag, keys in _ACTIVITY_DATA_KEYS:
+        if keys.issubset(value):
+            return tag
+    return "spl_common"
+
+_ACTIVITY_DATA_TAGS: dict[type[BaseModel], str] = {
+    GetTransactionActionsActivityDataSplMintBurn: "spl_mint_burn",
+    GetTransactionActionsActivityDataUnitLimit: "unit_limit",
+    GetTransactionActionsActivityDataUnitPrice: "unit_price",
+    GetTransactionActionsActivityDataSplCommon: "spl_common",
+    GetTransactionActionsActivityDataTokenSwap: "token_swap",
+    GetTransactionActionsActivityDataCreateAccount: "create_account"
+}
+
 # Data Type Alias
-GetTransactionActionsActivityData: TypeAlias = \
-      GetTransactionActionsActivityDataSplMintBurn \
-    | GetTransactionActionsActivityDataUnitLimit \
-    | GetTransactionActionsActivityDataUnitPrice \
-    | GetTransactionActionsActivityDataSplCommon \
-    | GetTransactionActionsActivityDataTokenSwap \
-    | GetTransactionActionsActivityDataCreateAccount
+GetTransactionActionsActivityData: TypeAlias = Annotated[
+    Union[
+        Annotated[GetTransactionActionsActivityDataSplMintBurn, Tag("spl_mint_burn")],
+        Annotated[GetTransactionActionsActivityDataUnitLimit, Tag("unit_limit")],
+        Annotated[GetTransactionActionsActivityDataUnitPrice, Tag("unit_price")],
+        Annotated[GetTransactionActionsActivityDataSplCommon, Tag("spl_common")],
+        Annotated[GetTransactionActionsActivityDataTokenSwap, Tag("token_swap")],
+        Annotated[GetTransactionActionsActivityDataCreateAccount, Tag("create_account")]
+    ],
+    Discriminator(_get_activity_data_tag)
+]
 
 class GetTransactionActionsActivity(BaseModel):
+    model_config = _FROZEN_CONFIG
+
     name: str
     activity_type: str
     program_id: str
@@ -1124,11 +1375,16 @@ class GetTransactionActionsData(BaseModel):
     transaction_id: str = Field(alias = "tx_hash")
     block_id: int
     block_time_unix_utc: int = Field(alias = "block_time")
-    time: datetime
     fee: int
     transfers: list[GetTransactionActionsTransfer] | None = None
     activities: list[GetTransactionActionsActivity] | None = None
 
+    @computed_field
+    @cached_property
+    def time(self) -> datetime:
+        """Block time in UTC timezone, computed (on first access) from `block_time_unix_utc`."""
+        return _from_unix(self.block_time_unix_utc)
+
 class GetTransactionActionsResponse(SolscanBaseResponse):
     """
         Model used to parse the response of the GET **[Transaction Actions](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-transaction-actions)** of **V2** API endpoint.
@@ -1141,15 +1397,22 @@ class GetBlockLastData(BaseModel):
     """
         Model used to parse the data of the GET **[Block Last](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-block-last)** of **V2** API endpoint.
     """
+    model_config = _RECORD_CONFIG
+
     block_id: str = Field(alias = "blockhash")
     fee_rewards: int
     transactions_count: int
     current_slot: int
     block_height: int
-    block_time_unix_utc: int = Field(alias = "block_time")
-    time: datetime
+    block_time_unix_utc: int
     parent_slot: int
-    previous_block_id: str = Field(alias = "previous_block_hash")
+    previous_block_id: str
+
+    @computed_field
+    @cached_property
+    def time(self) -> datetime:
+        """Block time in UTC timezone, computed (on first access) from `block_time_unix_utc`."""
+        return _from_unix(self.block_time_unix_utc)
 
 class GetBlockLastResponse(SolscanBaseResponse):
     """
@@ -1159,10 +1422,15 @@ class GetBlockLastResponse(SolscanBaseResponse):
 
 # GET - Block Transactions
 # Response
-class GetBlockTransactionsInstruction(GetAccountTransactionsInstruction):
-    pass
+GetBlockTransactionsInstruction: TypeAlias = GetAccountTransactionsInstruction
+"""
+    Model used to parse the instructions of the GET **[Block Transactions](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-block-transactions)** of **V2** API endpoint.
+    The model is an alias of `GetAccountTransactionsInstruction`.
+"""
 
 class GetBlockTransactionsDataTransaction(BaseModel):
+    model_config = _RECORD_CONFIG
+
     slot: int
     fee: int
     status: str
@@ -1171,7 +1439,12 @@ class GetBlockTransactionsDataTransaction(BaseModel):
     transaction_id: str = Field(alias = "tx_hash")
     parsed_instructions: list[GetBlockTransactionsInstruction]
     program_ids: list[str]
-    time: datetime
+
+    @computed_field
+    @cached_property
+    def time(self) -> datetime:
+        """Block time in UTC timezone, computed (on first access) from `block_time_unix_utc`."""
+        return _from_unix(self.block_time_unix_utc)
 
 class GetBlockTransactionsData(BaseModel):
     """
@@ -1197,10 +1470,15 @@ class GetBlockDetailData(BaseModel):
     transactions_count: int
     block_height: int
     block_time_unix_utc: int = Field(alias = "block_time")
-    time: datetime
     parent_slot: int
     previous_block_id: str = Field(alias = "previous_block_hash")
 
+    @computed_field
+    @cached_property
+    def time(self) -> datetime:
+        """Block time in UTC timezone, computed (on first access) from `block_time_unix_utc`."""
+        return _from_unix(self.block_time_unix_utc)
+
 class GetBlockDetailResponse(SolscanBaseResponse):
     """
         Model used to parse the response of the GET **[Block Detail](https://pro-api.solscan.io/pro-api-docs/v2.0/reference/v2-block-detail)** of **V2** API endpoint.
@@ -1,7 +1,9 @@
-from datetime import datetime, timedelta
+import asyncio
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
+import requests
 from pytest_mock import MockerFixture
 
 from cyhole.birdeye import Birdeye
@@ -23,6 +25,7 @@ from cyhole.birdeye.schema import (
     GetWalletSupportedNetworksResponse
 )
 from cyhole.birdeye.exception import BirdeyeAuthorisationError, BirdeyeTimeRangeError
+from cyhole.core.cache import FileCache, MemoryCache
 from cyhole.core.exception import MissingAPIKeyError
 from cyhole.core.token.solana import WSOL, USDC, BONK
 from cyhole.core.token.ethereum import WETH
@@ -53,6 +56,23 @@ class TestBirdeyePublic:
         with pytest.raises(MissingAPIKeyError):
             Birdeye()
 
+    def test_session_retry(self) -> None:
+        """
+            Unit Test to check the retry policy mounted on the session of the synchronous client.
+        """
+        birdeye = Birdeye(api_key = config.birdeye.api_key, max_retries = 3, backoff = 0.5)
+        with birdeye.client as client:
+            retry = client.get_session().get_adapter("https://public-api.birdeye.so").max_retries
+        assert retry.total == 3
+        assert retry.backoff_factor == 0.5
+        assert 429 in retry.status_forcelist
+        assert retry.is_retry("GET", 429)
+        assert not retry.is_retry("POST", 429)
+
+        # no retries by default
+        with self.birdeye.client as client:
+            assert client.get_session().get_adapter("https://public-api.birdeye.so").max_retries.total == 0
+
     def test_get_token_list_sync(self, mocker: MockerFixture) -> None:
         """
             Unit Test used to check the response schema of endpoint "Token - List" 
@@ -123,6 +143,94 @@ class TestBirdeyePublic:
         if config.mock_file_overwrite and not config.birdeye.mock_response_public:
             self.mocker.store_mock_model(mock_file_name, response)
 
+    def test_get_price_cached_sync(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """
+            Unit Test used to check that the response of endpoint "Price" 
+            is served from the cache on the second call for synchronous logic.
+
+            Mock Response File: get_price.json
+        """
+        birdeye = Birdeye(api_key = "test", cache = FileCache(tmp_path))
+
+        # load mock response
+        mock_response = self.mocker.load_mock_response("get_price", GetPriceResponse)
+        api = mocker.patch("cyhole.core.client.APIClient.api", return_value = mock_response)
+
+        # execute request
+        response = birdeye.client.get_price(address = WSOL.address)
+        response_cached = birdeye.client.get_price(address = WSOL.address)
+
+        # actual test
+        assert api.call_count == 1
+        assert response_cached == response
+
+    def test_unsuccessful_response_not_cached(self, mocker: MockerFixture) -> None:
+        """
+            Unit Test used to check that a response with `"success": false`
+            is not stored in the cache, so the next call reaches the API.
+        """
+        birdeye = Birdeye(api_key = "test", cache = MemoryCache())
+
+        # mock response
+        mock_response = requests.Response()
+        mock_response.status_code = 200
+        mock_response._content = b'{"success": false, "data": null}'
+        api = mocker.patch("cyhole.core.client.APIClient.api", return_value = mock_response)
+
+        # execute request
+        url = birdeye.url_api_public + "price"
+        birdeye.client.api("GET", url, params = {"address": WSOL.address})
+        birdeye.client.api("GET", url, params = {"address": WSOL.address})
+
+        # actual test
+        assert api.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_token_list_cached_async(self, mocker: MockerFixture) -> None:
+        """
+            Unit Test used to check that the response of endpoint "Token - List" 
+            is served from the memory cache on the second call for asynchronous logic.
+
+            Mock Response File: get_token_list.json
+        """
+        birdeye = Birdeye(api_key = "test", cache = MemoryCache())
+
+        # load mock response
+        mock_response = self.mocker.load_mock_response("get_token_list", GetTokenListResponse)
+        api = mocker.patch("cyhole.core.client.AsyncAPIClient.api", return_value = mock_response)
+
+        # execute request
+        async with birdeye.async_client as client:
+            response = await client.get_token_list(limit = 1)
+            response_cached = await client.get_token_list(limit = 1)
+
+        # actual test
+        assert api.call_count == 1
+        assert response_cached == response
+
+    @pytest.mark.asyncio
+    async def test_get_price_single_flight_async(self, mocker: MockerFixture) -> None:
+        """
+            Unit Test used to check that identical concurrent requests to endpoint "Price" 
+            are sent only once for asynchronous logic.
+
+            Mock Response File: get_price.json
+        """
+
+        # load mock response
+        mock_response = self.mocker.load_mock_response("get_price", GetPriceResponse)
+        api = mocker.patch("cyhole.core.client.AsyncAPIClient.api", return_value = mock_response)
+
+        # execute request
+        async with self.birdeye.async_client as client:
+            responses = await asyncio.gather(*(client.get_price(address = address) for address in [WSOL.address, WSOL.address, USDC.address]))
+            await client.get_price(address = WSOL.address)
+
+        # actual test
+        assert api.call_count == 3
+        assert responses[0] == responses[1]
+        assert not client._inflight
+
     @pytest.mark.asyncio
     async def test_get_price_async(self, mocker: MockerFixture) -> None:
         """
@@ -170,6 +278,10 @@ class TestBirdeyePublic:
         # actual test
         assert isinstance(response, GetPriceHistoricalResponse)
 
+        unix_times, values = response.data.to_arrays()
+        assert list(unix_times) == [item.unix_time for item in response.data.items]
+        assert list(values) == [item.value for item in response.data.items]
+
         # store request (only not mock)
         if config.mock_file_overwrite and not config.birdeye.mock_response_public:
             self.mocker.store_mock_model(mock_file_name, response)
@@ -201,6 +313,107 @@ class TestBirdeyePublic:
         # actual test
         assert isinstance(response, GetPriceHistoricalResponse)
 
+    @pytest.mark.asyncio
+    async def test_get_price_historical_many_async(self, mocker: MockerFixture) -> None:
+        """
+            Unit Test used to check the response schema of endpoint "Price - Historical" 
+            on multiple addresses executed concurrently for asynchronous logic.
+
+            Mock Response File: get_price_historical.json
+        """
+
+        # load mock response
+        mock_file_name = "get_price_historical"
+        if config.mock_response or config.birdeye.mock_response_public:
+            mock_response = self.mocker.load_mock_response(mock_file_name, GetPriceHistoricalResponse)
+            mocker.patch("cyhole.core.client.AsyncAPIClient.api", return_value = mock_response)
+
+        # execute request
+        async with self.birdeye.async_client as client:
+            response = await client.get_price_historical_many(
+                list_address = [WSOL.address, USDC.address],
+                address_type = BirdeyeAddressType.TOKEN.value,
+                timeframe = BirdeyeTimeFrame.MIN15.value,
+                dt_from = datetime.now() - timedelta(hours = 1),
+                max_concurrency = 1
+            )
+
+        # actual test
+        assert len(response) == 2
+        assert all(isinstance(item, GetPriceHistoricalResponse) for item in response)
+
+    def test_get_price_historical_timezone_aware_dates_sync(self, mocker: MockerFixture) -> None:
+        """
+            Unit Test used to check the conversion in unix timestamps of 
+            timezone-aware dates on endpoint "Price - Historical".
+
+            Mock Response File: get_price_historical.json
+        """
+
+        # load mock response
+        mock_response = self.mocker.load_mock_response("get_price_historical", GetPriceHistoricalResponse)
+        api = mocker.patch("cyhole.core.client.APIClient.api", return_value = mock_response)
+
+        # execute request
+        self.birdeye.client.get_price_historical(
+            address = WSOL.address,
+            address_type = BirdeyeAddressType.TOKEN.value,
+            timeframe = BirdeyeTimeFrame.MIN15.value,
+            dt_from = datetime(2024, 8, 1, tzinfo = timezone.utc),
+            dt_to = datetime(2024, 8, 1, 2, tzinfo = timezone(timedelta(hours = 1)))
+        )
+
+        # actual test
+        params = api.call_args.kwargs["params"]
+        assert params["time_from"] == 1722470400
+        assert params["time_to"] == 1722470400 + 3600
+
+    def test_get_price_historical_unix_dates_sync(self, mocker: MockerFixture) -> None:
+        """
+            Unit Test used to check that unix timestamps are accepted as dates 
+            on endpoint "Price - Historical".
+
+            Mock Response File: get_price_historical.json
+        """
+
+        # load mock response
+        mock_response = self.mocker.load_mock_response("get_price_historical", GetPriceHistoricalResponse)
+        api = mocker.patch("cyhole.core.client.APIClient.api", return_value = mock_response)
+
+        # execute request
+        self.birdeye.client.get_price_historical(
+            address = WSOL.address,
+            address_type = BirdeyeAddressType.TOKEN.value,
+            timeframe = BirdeyeTimeFrame.MIN15.value,
+            dt_from = 1722470400,
+            dt_to = datetime(2024, 8, 1, 1, tzinfo = timezone.utc)
+        )
+
+        # actual test
+        params = api.call_args.kwargs["params"]
+        assert params["time_from"] == 1722470400
+        assert params["time_to"] == 1722470400 + 3600
+
+        # inconsistent time window
+        with pytest.raises(BirdeyeTimeRangeError):
+            self.birdeye.client.get_price_historical(
+                address = WSOL.address,
+                address_type = BirdeyeAddressType.TOKEN.value,
+                timeframe = BirdeyeTimeFrame.MIN15.value,
+                dt_from = 1722470400,
+                dt_to = 1722470400 - 1
+            )
+
+        # booleans are not unix timestamps
+        with pytest.raises(BirdeyeTimeRangeError):
+            self.birdeye.client.get_price_historical(
+                address = WSOL.address,
+                address_type = BirdeyeAddressType.TOKEN.value,
+                timeframe = BirdeyeTimeFrame.MIN15.value,
+                dt_from = True,
+                dt_to = 1722470400
+            )
+
     def test_get_price_historical_incorrect_input_dates_sync(self, mocker: MockerFixture) -> None:
         """
             Unit Test used to check the incorrect dates inputs (dt_from > dt_to) 
@@ -308,6 +521,81 @@ class TestBirdeyePrivate:
         # actual test
         assert isinstance(response, GetPriceMultipleResponse)
 
+    def test_get_price_multiple_chunks_sync(self, mocker: MockerFixture) -> None:
+        """
+            Unit Test used to check that endpoint "Price - Multiple" is called 
+            by chunks of addresses when the list exceeds the limit of a request.
+
+            Mock Response File: get_price_multiple.json
+        """
+
+        # load mock response
+        mock_response = self.mocker.load_mock_response("get_price_multiple", GetPriceMultipleResponse)
+        api = mocker.patch("cyhole.core.client.APIClient.api", return_value = mock_response)
+
+        # execute request
+        tokens_ca = [WSOL.address, USDC.address] + [f"{WSOL.address[:-3]}{index:03d}" for index in range(148)]
+        response = self.birdeye.client.get_price_multiple(list_address = tokens_ca)
+
+        # actual test
+        assert api.call_count == 2
+        assert isinstance(response, GetPriceMultipleResponse)
+        assert response.data == GetPriceMultipleResponse.model_validate_json(mock_response.content).data
+
+    @pytest.mark.asyncio
+    async def test_get_price_multiple_chunks_async(self, mocker: MockerFixture) -> None:
+        """
+            Unit Test used to check that endpoint "Price - Multiple" is called 
+            by chunks of addresses with bounded concurrency for asynchronous logic.
+
+            Mock Response File: get_price_multiple.json
+        """
+
+        # load mock response
+        mock_response = self.mocker.load_mock_response("get_price_multiple", GetPriceMultipleResponse)
+        api = mocker.patch("cyhole.core.client.AsyncAPIClient.api", return_value = mock_response)
+
+        # execute request
+        tokens_ca = [f"{WSOL.address[:-3]}{index:03d}" for index in range(250)]
+        async with self.birdeye.async_client as client:
+            response = await client.get_price_multiple(list_address = tokens_ca, max_concurrency = 2)
+
+        # actual test
+        assert api.call_count == 3
+        assert isinstance(response, GetPriceMultipleResponse)
+
+    def test_get_price_multiple_unique_addresses_sync(self, mocker: MockerFixture) -> None:
+        """
+            Unit Test used to check that endpoint "Price - Multiple" is called 
+            with stripped and unique addresses.
+
+            Mock Response File: get_price_multiple.json
+        """
+
+        # load mock response
+        mock_response = self.mocker.load_mock_response("get_price_multiple", GetPriceMultipleResponse)
+        api = mocker.patch("cyhole.core.client.APIClient.api", return_value = mock_response)
+
+        # execute request
+        tokens_ca = [WSOL.address, f" {USDC.address}", WSOL.address, f"{USDC.address} "] * 50
+        self.birdeye.client.get_price_multiple(list_address = tokens_ca)
+
+        # actual test
+        assert api.call_count == 1
+        assert api.call_args.kwargs["params"]["list_address"] == f"{WSOL.address},{USDC.address}"
+
+    def test_get_price_multiple_invalid_concurrency(self, mocker: MockerFixture) -> None:
+        """
+            Unit Test used to check that endpoint "Price - Multiple" raises 
+            `ValueError` before any request when `max_concurrency` is lower than 1.
+        """
+        api = mocker.patch("cyhole.core.client.APIClient.api")
+
+        # actual test
+        with pytest.raises(ValueError):
+            self.birdeye.client.get_price_multiple(list_address = [WSOL.address], max_concurrency = 0)
+        assert api.call_count == 0
+
     def test_get_price_volume_single_sync(self, mocker: MockerFixture) -> None:
         """
             Unit Test used to check the response schema of endpoint "Price Volume - Single Token" 
@@ -494,6 +782,30 @@ class TestBirdeyePrivate:
         assert isinstance(response, GetTokenSecurityResponse)
         assert isinstance(response.data, GetTokenSecurityDataSolana)
 
+    def test_get_token_security_cached_sync(self, mocker: MockerFixture) -> None:
+        """
+            Unit Test used to check that the response of endpoint "Token - Security" 
+            is served from the cache on the second call for the same chain only.
+
+            Mock Response File: get_token_security_solana.json
+        """
+        cache = MemoryCache()
+        birdeye = Birdeye(api_key = "test", cache = cache)
+        birdeye_ethereum = Birdeye(api_key = "test", chain = BirdeyeChain.ETHEREUM.value, cache = cache)
+
+        # load mock response
+        mock_response = self.mocker.load_mock_response("get_token_security_solana", GetTokenSecurityResponse)
+        api = mocker.patch("cyhole.core.client.APIClient.api", return_value = mock_response)
+
+        # execute request
+        response = birdeye.client.get_token_security(JRK)
+        response_cached = birdeye.client.get_token_security(JRK)
+        birdeye_ethereum.client.get_token_security(JRK)
+
+        # actual test
+        assert api.call_count == 2
+        assert response_cached == response
+
     def test_get_token_security_other_sync(self, mocker: MockerFixture) -> None:
         """
             Unit Test used to check the response schema of endpoint "Token - Security" 
@@ -768,6 +1080,35 @@ class TestBirdeyePrivate:
                     dt_from = datetime.now() + timedelta(hours = 1)
                 )
 
+    def test_get_ohlcv_closed_window_cached_sync(self, mocker: MockerFixture) -> None:
+        """
+            Unit Test used to check that the response of endpoint "OHLCV - Token" 
+            on a closed time window is served from the cache without expiration.
+
+            Mock Response File: get_ohlcv_token.json
+        """
+        birdeye = Birdeye(api_key = "test", cache = MemoryCache())
+
+        # load mock response
+        mock_response = self.mocker.load_mock_response("get_ohlcv_token", GetOHLCVTokenPairResponse)
+        api = mocker.patch("cyhole.core.client.APIClient.api", return_value = mock_response)
+
+        # execute request
+        dt_to = datetime.now() - timedelta(days = 1)
+        for _ in range(2):
+            response = birdeye.client.get_ohlcv(
+                address = WSOL.address,
+                address_type = BirdeyeAddressType.TOKEN.value,
+                timeframe = BirdeyeTimeFrame.MIN15.value,
+                dt_from = dt_to - timedelta(hours = 1),
+                dt_to = dt_to
+            )
+
+        # actual test
+        assert api.call_count == 1
+        assert isinstance(response, GetOHLCVTokenPairResponse)
+        assert birdeye._get_cache_ttl("GET", birdeye.url_api_public + "ohlcv", api.call_args.kwargs["params"]) == float("inf")
+
     def test_get_ohlcv_token_sync(self, mocker: MockerFixture) -> None:
         """
             Unit Test used to check the response schema of endpoint "OHLCV - Token" 
@@ -1,6 +1,10 @@
 import pytest
+import requests
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 from cyhole.core.token.solana import SOL
+from cyhole.core.cache import FileCache, MemoryCache
 from cyhole.core.interaction import Interaction
 from cyhole.core.client import APIClient, AsyncAPIClient
 from cyhole.core.param import CyholeParam, RequestType
@@ -52,6 +56,57 @@ def test_sync_client_api_post() -> None:
     assert response.status_code == 200
     assert response.content.decode() is not None
 
+def test_sync_client_init() -> None:
+    """
+        Unit Test to check the correct init of APIClient.
+    """
+    sync_client = APIClient(interaction)
+
+    assert sync_client._session is None
+    assert not sync_client.is_connected()
+
+def test_sync_client_close_connetion() -> None:
+    """
+        Unit Test to check the correct closing connection of APIClient.
+    """
+    sync_client = APIClient(interaction)
+    sync_client.connect()
+    assert sync_client.is_connected()
+
+    sync_client.close()
+    assert sync_client._session is None
+    assert not sync_client.is_connected()
+
+def test_sync_client_session_headers() -> None:
+    """
+        Unit Test to check that the global headers are set on the session of APIClient.
+    """
+    headers = {"X-API-KEY": "test"}
+    sync_client = APIClient(interaction, headers = headers)
+    session = sync_client.get_session()
+
+    assert session is sync_client.get_session()
+    assert session.headers["X-API-KEY"] == "test"
+    sync_client.close()
+
+def test_sync_client_max_retries() -> None:
+    """
+        Unit Test to check the retry policy of the session of APIClient.
+    """
+    with APIClient(interaction) as sync_client:
+        assert sync_client.get_session().get_adapter("https://").max_retries.total == 0
+    with APIClient(interaction, max_retries = 2) as sync_client:
+        assert sync_client.get_session().get_adapter("https://").max_retries.total == 2
+
+def test_sync_client_context_manager() -> None:
+    """
+        Unit Test to check the correct usage of context manager of APIClient.
+    """
+    with APIClient(interaction) as sync_client:
+        assert sync_client._session is not None
+        assert sync_client.is_connected()
+    assert not sync_client.is_connected()
+
 @pytest.mark.asyncio
 async def test_async_client_init() -> None:
     """
@@ -177,4 +232,60 @@ def test_token_int_to_float() -> None:
     """
         Unit Test for `CyholeToken.int_to_float` function.
     """
-    assert SOL.int_to_float(1_011_000_000) == 1.011
\ No newline at end of file
+    assert SOL.int_to_float(1_011_000_000) == 1.011
+
+def test_file_cache(tmp_path: Path) -> None:
+    """
+        Unit Test for `FileCache` store and expiration of the responses.
+    """
+    cache = FileCache(tmp_path)
+    response = requests.Response()
+    response._content = b'{"test": "data"}'
+
+    assert cache.get("test", URL_TEST_GET, {"a": 1}) is None
+    cache.set("test", URL_TEST_GET, {"a": 1}, response)
+
+    cached = cache.get("test", URL_TEST_GET, {"a": 1}, ttl = 60)
+    assert cached is not None
+    assert cached.status_code == 200
+    assert cached.json() == {"test": "data"}
+    assert cache.get("test", URL_TEST_GET, {"a": 2}, ttl = 60) is None
+    assert cache.get("test", URL_TEST_GET, {"a": 1}, ttl = 0) is None
+
+    # the entry is replaced atomically, no temporary file is left
+    cache.set("test", URL_TEST_GET, {"a": 1}, response)
+    assert [file.suffix for file in (tmp_path / "test").iterdir()] == [".json"]
+
+def test_memory_cache() -> None:
+    """
+        Unit Test for `MemoryCache` store, expiration and eviction of the responses.
+    """
+    cache = MemoryCache(maxsize = 2)
+    response = requests.Response()
+    response._content = b'{"test": "data"}'
+
+    cache.set("test", URL_TEST_GET, {"a": 1}, response)
+    cache.set("test", URL_TEST_GET, {"a": 2}, response)
+    assert cache.get("test", URL_TEST_GET, {"a": 1}, ttl = 60).json() == {"test": "data"}
+    assert cache.get("test", URL_TEST_GET, {"a": 1}, ttl = 0) is None
+
+    # the least recently used entry is discarded
+    cache.set("test", URL_TEST_GET, {"a": 3}, response)
+    assert cache.get("test", URL_TEST_GET, {"a": 2}) is None
+    assert cache.get("test", URL_TEST_GET, {"a": 1}) is not None
+
+def test_memory_cache_threads() -> None:
+    """
+        Unit Test for `MemoryCache` shared by several threads.
+    """
+    cache = MemoryCache(maxsize = 8)
+    response = requests.Response()
+    response._content = b'{"test": "data"}'
+
+    def store_and_load(index: int) -> None:
+        cache.set("test", URL_TEST_GET, {"a": index % 16}, response)
+        cache.get("test", URL_TEST_GET, {"a": (index + 1) % 16})
+
+    with ThreadPoolExecutor(max_workers = 8) as executor:
+        list(executor.map(store_and_load, range(2000)))
+    assert len(cache._entries) == 8
\ No newline at end of file
@@ -69,7 +69,7 @@ class TestSolscanV1:
             mock_response = self.mocker.load_mock_response(mock_file_name, SolscanHTTPError)
             mock_response.status_code = 400
 
-            mocker.patch("requests.get", return_value = mock_response)
+            mocker.patch("requests.Session.get", return_value = mock_response)
 
         # execute request
         with pytest.raises(SolscanException):
@@ -1,11 +1,12 @@
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 
+from pydantic import TypeAdapter, ValidationError
 from pytest_mock import MockerFixture
 
 from cyhole.core.token.solana import JUP, WSOL
-from cyhole.core.exception import MissingAPIKeyError
+from cyhole.core.exception import MissingAPIKeyError, ParamUnknownError
 from cyhole.solscan.v2 import Solscan
 from cyhole.solscan.v2.exception import (
     SolscanInvalidAmountRange,
@@ -44,6 +45,7 @@ from cyhole.solscan.v2.schema import (
     GetTokenMarketsResponse,
     GetTokenListResponse,
     GetTokenTrendingResponse,
+    GetTokenPriceData,
     GetTokenPriceResponse,
     GetTokenHoldersResponse,
     GetTokenMetaResponse,
@@ -55,6 +57,8 @@ from cyhole.solscan.v2.schema import (
     GetNFTCollectionItemsResponse,
     GetTransactionLastResponse,
     GetTransactionActionsResponse,
+    GetTransactionActionsActivityData,
+    GetTransactionActionsActivityDataSplCommon,
     GetBlockLastResponse,
     GetBlockTransactionsResponse,
     GetBlockDetailResponse
@@ -98,7 +102,7 @@ class TestSolscanV2:
             mock_response = self.mocker.load_mock_response(mock_file_name, SolscanHTTPError)
             mock_response.status_code = 500
 
-            mocker.patch("requests.get", return_value = mock_response)
+            mocker.patch("requests.Session.get", return_value = mock_response)
 
         # execute request
         with pytest.raises(SolscanException):
@@ -125,6 +129,72 @@ class TestSolscanV2:
             async with self.solscan.async_client as client:
                 await client.get_block_detail(123456789123)
 
+    def test_param_to_query(self) -> None:
+        """
+            Unit Test used to check that the query parameters built by
+            the params models are aligned to the pydantic serialization.
+        """
+        params = [
+            GetAccountTransferParam(
+                activity_type = [SolscanActivityTransferType.SPL_TRANSFER.value, SolscanActivityTransferType.SPL_MINT.value],
+                from_address = SOLSCAN_DONATION_ADDRESS,
+                amount_range = (1, 100),
+                time_range = (datetime(2024, 8, 1), datetime(2024, 8, 31)),
+                exclude_amount_zero = False,
+                token_address = JUP.address,
+                flow_direction = SolscanFlowType.INCOMING.value,
+                page = 2,
+                page_size = SolscanPageSizeType.SIZE_20.value
+            ),
+            GetTokenDefiActivitiesParam(
+                activity_type = SolscanActivityDefiType.TOKEN_SWAP.value,
+                platform_address = [SOLSCAN_DONATION_ADDRESS],
+                time_range = (datetime(2024, 8, 1), datetime(2024, 8, 31)),
+                token_address = JUP.address
+            ),
+            GetAccountBalanceChangeActivitiesParam(
+                token_address = WSOL.address,
+                remove_spam = True,
+                amount_range = (1, 100),
+                flow_direction = SolscanFlowType.OUTGOING.value
+            ),
+            GetNFTActivitiesParam(
+                activity_type = SolscanActivityNFTType.SOLD.value,
+                amount_range = (1, 100),
+                time_range = (datetime(2024, 8, 1), datetime(2024, 8, 31))
+            ),
+            GetNFTCollectionListsParam(
+                days_range = SolscanNFTDaysRangeType.DAYS_7.value,
+                sort_by = SolscanNFTSortType.FLOOR_PRICE.value
+            ),
+            GetTokenTransferParam()
+        ]
+
+        # actual test
+        for param in params:
+            dump = param.model_dump(by_alias = True, exclude_defaults = True)
+            assert param.to_query() == {key: value for key, value in dump.items() if value is not None}
+        assert params[0].to_query()["exclude_amount_zero"] == "false"
+        assert params[2].to_query()["remove_spam"] == "true"
+
+        # timezone-aware time range
+        param = GetAccountTransferParam(time_range = (datetime(2024, 8, 1, tzinfo = timezone.utc), datetime(2024, 8, 31, tzinfo = timezone.utc)))
+        assert param.to_query()["block_time[]"] == (1722470400, 1725062400)
+
+        # unix timestamps time range
+        param = GetAccountTransferParam(time_range = (1722470400, 1725062400))
+        assert param.to_query()["block_time[]"] == (1722470400, 1725062400)
+        with pytest.raises(SolscanInvalidTimeRange):
+            GetAccountTransferParam(time_range = (1725062400, 1722470400))
+
+        # list and ISO strings time range
+        param = GetAccountTransferParam(time_range = [datetime(2024, 8, 1, tzinfo = timezone.utc), datetime(2024, 8, 31, tzinfo = timezone.utc)])
+        assert param.to_query()["block_time[]"] == (1722470400, 1725062400)
+        param = GetAccountTransferParam(time_range = ["2024-08-01T00:00:00Z", "2024-08-31T00:00:00+00:00"])
+        assert param.to_query()["block_time[]"] == (1722470400, 1725062400)
+        with pytest.raises(ValidationError):
+            GetAccountTransferParam(time_range = ("start", "end"))
+
     def test_get_account_transfers_sync(self, mocker: MockerFixture) -> None:
         """
             Unit Test used to check the response schema of endpoint 
@@ -321,6 +391,17 @@ class TestSolscanV2:
         # actual test
         assert isinstance(response, GetAccountBalanceChangeActivitiesResponse)
 
+    def test_param_invalid_activity_type(self) -> None:
+        """
+            Unit Test used to check that an unsupported activity type
+            is rejected by the params, both as single value and in a list.
+        """
+        with pytest.raises(ParamUnknownError):
+            GetAccountTransferParam(activity_type = "UNKNOWN")
+
+        with pytest.raises(ParamUnknownError):
+            GetNFTActivitiesParam(activity_type = [SolscanActivityNFTType.SOLD.value, "UNKNOWN"])
+
     def test_get_account_balance_change_activities_invalid_amount_range(self, mocker: MockerFixture) -> None:
         """
             Unit Test used to check the response from endpoint 
@@ -880,6 +961,18 @@ class TestSolscanV2:
                 time_range = (datetime(2024, 8, 10), datetime(2024, 8, 1))
             )
 
+    def test_get_token_price_data_date(self) -> None:
+        """
+            Unit Test used to check that the date of the token price
+            is built from `YYYYMMDD` integers or datetimes, and that 
+            any other value raises a `ValidationError`.
+        """
+        # actual test
+        assert GetTokenPriceData(date = 20240101, price = 1.0).date == datetime(2024, 1, 1)
+        assert GetTokenPriceData(date = datetime(2024, 1, 1), price = 1.0).date == datetime(2024, 1, 1)
+        with pytest.raises(ValidationError):
+            GetTokenPriceData(date = 2024.0101, price = 1.0)
+
     def test_get_token_holders_sync(self, mocker: MockerFixture) -> None:
         """
             Unit Test used to check the response schema of endpoint 
@@ -1305,6 +1398,22 @@ class TestSolscanV2:
             # actual test
             assert isinstance(response, GetTransactionActionsResponse)
 
+    def test_get_transaction_actions_activity_data_fallback(self) -> None:
+        """
+            Unit Test used to check that the data of a transaction activity
+            missing the required keys of the model identified by its marker 
+            key (e.g. `amm_id`, `common_type`) are parsed as SPL common.
+        """
+        adapter = TypeAdapter(GetTransactionActionsActivityData)
+        payloads = [
+            {"amm_id": "x", "token_address": "t"},
+            {"new_account": "n", "token_address": "t", "common_type": "c"}
+        ]
+
+        # actual test
+        for payload in payloads:
+            assert isinstance(adapter.validate_python(payload), GetTransactionActionsActivityDataSplCommon)
+
     def test_get_block_last_sync(self, mocker: MockerFixture) -> None:
         """
             Unit Test used to check the response schema of endpoint 